@@ -6,6 +6,7 @@ Usage:
     python api_service.py                    # Start API server on port 8000
     python api_service.py --port 8080       # Start on custom port
     python api_service.py --host 0.0.0.0    # Bind to all interfaces
+    python api_service.py --workers 4       # Run 4 worker processes
 
 API Endpoints:
     POST /scrape                             # Scrape a URL
@@ -17,6 +18,7 @@ API Endpoints:
     GET /stats                               # Get statistics
     DELETE /results/{id}                     # Delete result
     GET /health                              # Health check
+    GET /pool-health                         # Database pool statistics
 
 Features:
     - RESTful API with FastAPI
@@ -29,10 +31,16 @@ Features:
 """
 
 import asyncio
+import hmac
 import json
-import sqlite3
+import multiprocessing
+import os
 import time
-from datetime import datetime, timedelta
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlparse, unquote
@@ -41,14 +49,38 @@ import logging
 # FastAPI and related imports
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Query, Path as PathParam
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
+from cachetools import TTLCache
+import orjson
 import uvicorn
 
+try:
+    from brotli_asgi import BrotliMiddleware
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# Faster event loop and HTTP parser, installed with uvicorn[standard]
+try:
+    import uvloop  # noqa: F401
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import httptools  # noqa: F401
+    HAS_HTTPTOOLS = True
+except ImportError:
+    HAS_HTTPTOOLS = False
+
 # Import our scraping components
-from master_scraper import ProgressiveScraper, ScrapingDatabase
+from master_scraper import ScrapingDatabase
 from vpn_checker import async_check_vpn
+from db_pool import SQLitePool, PoolTimeout
+import scrape_worker
 
 
 # Pydantic models for API
@@ -61,16 +93,16 @@ class ScrapeRequest(BaseModel):
     )
     output_format: Optional[str] = Field(default="json", description="Output format")
     config: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Scraping configuration")
+    force_rescrape: bool = Field(default=False, description="Ignore cached results and scrape again")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "url": "https://example.com",
-                "methods": ["scrapy", "pydoll"],
-                "output_format": "json",
-                "config": {"verify_ssl": False, "timeout": 30}
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "url": "https://example.com",
+            "methods": ["scrapy", "pydoll"],
+            "output_format": "json",
+            "config": {"verify_ssl": False, "timeout": 30}
         }
+    })
 
 
 class ScrapeResponse(BaseModel):
@@ -114,27 +146,113 @@ class DatabaseStats(BaseModel):
     response_time_stats: Dict[str, float]
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# JSON-encoded result columns and the keys they are returned under
+JSON_COLUMNS = {'data_json': 'data', 'links_json': 'links', 'images_json': 'images'}
+
+
+def _rowdict(plan: List[tuple], row: tuple) -> Dict[str, Any]:
+    """Convert a result row to a dict, decoding JSON columns"""
+    result = {}
+    for (column, alias), value in zip(plan, row):
+        if alias and value:
+            try:
+                result[alias] = orjson.loads(value)
+                continue
+            except orjson.JSONDecodeError:
+                pass
+        result[column] = value
+    return result
+
+
+def _column_plan(cursor) -> List[tuple]:
+    """(column, decoded key) pairs for a cursor, computed once per query"""
+    return [(desc[0], JSON_COLUMNS.get(desc[0])) for desc in cursor.description]
+
+
+def fetch_rows(cursor) -> List[Dict[str, Any]]:
+    """Fetch all rows from cursor as result dicts"""
+    plan = _column_plan(cursor)
+    return [_rowdict(plan, row) for row in cursor.fetchall()]
+
+
+def fetch_row(cursor) -> Optional[Dict[str, Any]]:
+    """Fetch one row from cursor as a result dict"""
+    row = cursor.fetchone()
+    return _rowdict(_column_plan(cursor), row) if row else None
+
+
+# Pooled queries run in a worker thread so SQLite never blocks the event loop
+async def query_rows(sql: str, params=()) -> List[Dict[str, Any]]:
+    """Run a read query and return all rows as result dicts"""
+    async with db_pool.get_conn(readonly=True) as conn:
+        return await asyncio.to_thread(lambda: fetch_rows(conn.execute(sql, params)))
+
+
+async def query_row(sql: str, params=()) -> Optional[Dict[str, Any]]:
+    """Run a read query and return the first row as a result dict"""
+    async with db_pool.get_conn(readonly=True) as conn:
+        return await asyncio.to_thread(lambda: fetch_row(conn.execute(sql, params)))
+
+
+async def stream_rows(sql: str, params=(), chunk_size: int = 256):
+    """Yield NDJSON-encoded result rows, fetching chunk_size rows at a time"""
+    async with db_pool.get_conn(readonly=True) as conn:
+        cursor = await asyncio.to_thread(conn.execute, sql, params)
+        plan = _column_plan(cursor)
+        while True:
+            rows = await asyncio.to_thread(cursor.fetchmany, chunk_size)
+            if not rows:
+                break
+            yield b"".join(orjson.dumps(_rowdict(plan, row)) + b"\n" for row in rows)
+
+
+async def query_raw(sql: str, params=(), one: bool = False):
+    """Run a read query and return raw tuples (or only the first with one=True)"""
+    async with db_pool.get_conn(readonly=True) as conn:
+        def run():
+            cursor = conn.execute(sql, params)
+            return cursor.fetchone() if one else cursor.fetchall()
+        return await asyncio.to_thread(run)
+
+
 # Background task tracking
+MAX_TASKS = int(os.environ.get("SCRAPER_MAX_TASKS", 10000))
+
+
 class TaskManager:
     """Manage background scraping tasks"""
     
-    def __init__(self):
-        self.tasks: Dict[str, Dict[str, Any]] = {}
-        self.completed_tasks: Dict[str, Any] = {}
+    FINISHED = ("completed", "failed")
+    # Stored as time.time() floats; formatted as ISO 8601 UTC only when served
+    TIMESTAMP_FIELDS = ("created_at", "started_at", "completed_at")
+    
+    def __init__(self, max_tasks: int = MAX_TASKS):
+        # Insertion-ordered so the oldest tasks are evicted first
+        self.tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_tasks = max_tasks
     
     def create_task(self, task_id: str, url: str) -> Dict[str, Any]:
         """Create a new task"""
         task = {
             "task_id": task_id,
             "url": url,
-            "status": "pending",
-            "created_at": datetime.now().isoformat(),
+            "status": "queued",
+            "created_at": time.time(),
             "started_at": None,
             "completed_at": None,
             "result_id": None,
             "error": None
         }
         self.tasks[task_id] = task
+        while len(self.tasks) > self.max_tasks:
+            self.tasks.popitem(last=False)
         return task
     
     def update_task(self, task_id: str, **updates):
@@ -143,26 +261,65 @@ class TaskManager:
             self.tasks[task_id].update(updates)
     
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
-        """Get task by ID"""
-        return self.tasks.get(task_id) or self.completed_tasks.get(task_id)
+        """Get task by ID, with timestamps formatted for output"""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return None
+        
+        formatted = dict(task)
+        for field in self.TIMESTAMP_FIELDS:
+            if formatted[field] is not None:
+                formatted[field] = datetime.fromtimestamp(formatted[field], tz=timezone.utc).isoformat()
+        return formatted
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of queued, active and finished tasks"""
+        queued = finished = 0
+        for task in self.tasks.values():
+            if task["status"] == "queued":
+                queued += 1
+            elif task["status"] in self.FINISHED:
+                finished += 1
+        return {"queued": queued, "active": len(self.tasks) - finished, "completed": finished}
     
     def complete_task(self, task_id: str, result_id: Optional[int] = None, error: Optional[str] = None):
         """Mark task as completed"""
         if task_id in self.tasks:
-            task = self.tasks[task_id]
-            task.update({
+            self.tasks[task_id].update({
                 "status": "completed" if result_id else "failed",
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": time.time(),
                 "result_id": result_id,
                 "error": error
             })
-            self.completed_tasks[task_id] = task
-            del self.tasks[task_id]
 
 
 # Global instances
 task_manager = TaskManager()
 scraping_db = ScrapingDatabase()
+db_pool = SQLitePool(scraping_db.db_path)
+
+# Recent successful results keyed by normalized URL: (result_id, stored_at).
+# SCRAPER_CACHE_DOMAIN_TTLS is a JSON object of per-domain TTL overrides.
+CACHE_TTL = int(os.environ.get("SCRAPER_CACHE_TTL", 300))
+CACHE_DOMAIN_TTLS: Dict[str, int] = json.loads(os.environ.get("SCRAPER_CACHE_DOMAIN_TTLS", "{}"))
+result_cache = TTLCache(maxsize=10000, ttl=max([CACHE_TTL, *CACHE_DOMAIN_TTLS.values()]))
+
+# Results waiting for the writer task, paired with a future for their row ID
+WRITE_BATCH_SIZE = 128
+write_queue: Optional[asyncio.Queue] = None
+writer_task: Optional[asyncio.Task] = None
+
+# Last successful VPN check, reused for VPN_CHECK_TTL seconds
+VPN_CHECK_TTL = float(os.environ.get("SCRAPER_VPN_CHECK_TTL", 15))
+_vpn_cache = {"ts": 0.0, "active": False, "msg": "", "ip": None}
+_vpn_lock: Optional[asyncio.Lock] = None
+
+# Scrapes allowed to run at once; further tasks wait in "queued" status
+MAX_CONCURRENT_SCRAPES = int(os.environ.get("SCRAPER_MAX_CONCURRENT", 20))
+_scrape_sem = asyncio.BoundedSemaphore(MAX_CONCURRENT_SCRAPES)
+
+# Worker processes running scrapes (see scrape_worker.py); None scrapes in-process
+scrape_executor: Optional[ProcessPoolExecutor] = None
 
 # FastAPI app
 app = FastAPI(
@@ -170,7 +327,8 @@ app = FastAPI(
     description="RESTful API for progressive web scraping with multiple methods",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -182,7 +340,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Security (optional)
+# Response compression: brotli when available (falling back to gzip for
+# clients without br support), otherwise gzip
+if HAS_BROTLI:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Security (optional) - bearer auth is only enforced when API_AUTH_SECRET is set
+AUTH_SECRET = os.environ.get("API_AUTH_SECRET", "")
+AUTH_ENABLED = bool(AUTH_SECRET)
+NO_AUTH = {"user_id": "anonymous"}
+
 security = HTTPBearer(auto_error=False)
 
 # Logging setup
@@ -190,12 +359,61 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@app.on_event("startup")
+async def on_startup():
+    """Open pooled database connections and start the result writer"""
+    global write_queue, writer_task, scrape_executor, _vpn_lock
+    
+    await db_pool.open()
+    _vpn_lock = asyncio.Lock()
+    write_queue = asyncio.Queue()
+    writer_task = asyncio.create_task(writer_loop())
+    
+    if scrape_worker.WORKERS > 0:
+        # spawn, not fork: the parent already has threads and open connections
+        scrape_executor = ProcessPoolExecutor(
+            max_workers=scrape_worker.WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=scrape_worker.init_worker
+        )
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Flush pending results, then close pooled connections"""
+    if writer_task:
+        await write_queue.join()
+        writer_task.cancel()
+    
+    if scrape_executor:
+        scrape_executor.shutdown(wait=False, cancel_futures=True)
+    await scrape_worker.close_http_clients()
+    
+    await db_pool.close()
+
+
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request, exc: PoolTimeout):
+    """Report pool exhaustion as a temporary condition"""
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+
 # Dependency functions
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Optional authentication dependency"""
-    # For now, no authentication required
-    # In production, verify JWT tokens here
-    return {"user_id": "anonymous"}
+if AUTH_ENABLED:
+    async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+        """Authentication dependency: require the shared bearer secret"""
+        # In production, verify JWT tokens here
+        if not credentials or not hmac.compare_digest(credentials.credentials, AUTH_SECRET):
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or missing credentials",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+        return {"user_id": "authenticated"}
+else:
+    async def get_current_user():
+        """Authentication disabled: skip Authorization header parsing entirely"""
+        return NO_AUTH
 
 
 def validate_url(url: str) -> str:
@@ -210,6 +428,93 @@ def validate_url(url: str) -> str:
     return url
 
 
+def normalize_url(url: str) -> str:
+    """Normalize a validated URL for use as a cache key"""
+    parsed = urlparse(url)
+    return parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        path=parsed.path or "/",
+        fragment=""
+    ).geturl()
+
+
+def cache_ttl_for(url: str) -> int:
+    """Cache TTL in seconds for the URL's domain"""
+    return CACHE_DOMAIN_TTLS.get(urlparse(url).netloc.lower(), CACHE_TTL)
+
+
+async def find_cached_result(url: str) -> Optional[int]:
+    """Return the ID of a successful result for url younger than its TTL"""
+    ttl = cache_ttl_for(url)
+    if ttl <= 0:
+        return None
+    
+    key = normalize_url(url)
+    cached = result_cache.get(key)
+    if cached and time.time() - cached[1] < ttl:
+        return cached[0]
+    
+    row = await query_raw("""
+        SELECT id, timestamp FROM scrape_results
+        WHERE url = ? AND status = 'success'
+        ORDER BY timestamp DESC
+        LIMIT 1
+    """, (url,), one=True)
+    
+    if not row:
+        return None
+    
+    result_id, timestamp = row
+    age = (datetime.now() - datetime.fromisoformat(timestamp)).total_seconds()
+    if age >= ttl:
+        return None
+    
+    result_cache[key] = (result_id, time.time() - age)
+    return result_id
+
+
+def like_prefix(value: str) -> str:
+    """LIKE pattern matching values that start with value (index-usable, ESCAPE '\\')"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+@lru_cache(maxsize=None)
+def list_results_sql(by_status: bool, by_domain: bool, after_cursor: bool) -> tuple:
+    """(page query, last-key query) for a /results filter combination, built once per shape"""
+    where = "WHERE 1=1"
+    if by_status:
+        where += " AND status = ?"
+    if by_domain:
+        where += " AND domain LIKE ? ESCAPE '\\'"
+    if after_cursor:
+        where += " AND (timestamp, id) < (?, ?)"
+    
+    order = "ORDER BY timestamp DESC, id DESC"
+    return (
+        f"SELECT * FROM scrape_results {where} {order} LIMIT ? OFFSET ?",
+        f"SELECT timestamp, id FROM scrape_results {where} {order} LIMIT 1 OFFSET ?"
+    )
+
+
+def make_cursor(timestamp: str, result_id: int) -> str:
+    """Opaque keyset pagination cursor for a result row"""
+    return f"{timestamp}|{result_id}"
+
+
+def parse_cursor(cursor: str) -> tuple:
+    """Split a pagination cursor into (timestamp, id)"""
+    timestamp, _, result_id = cursor.rpartition("|")
+    if not timestamp or not result_id.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return timestamp, int(result_id)
+
+
+def fts_query(q: str) -> str:
+    """Build an FTS5 MATCH expression matching every term of q as a prefix"""
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in q.split())
+
+
 # API Routes
 @app.get("/", summary="Root endpoint")
 async def root():
@@ -233,19 +538,31 @@ async def health_check():
     """Health check endpoint"""
     try:
         # Test database connection
-        with sqlite3.connect(scraping_db.db_path) as conn:
-            conn.execute("SELECT 1").fetchone()
+        await query_raw("SELECT 1", one=True)
         
         db_status = "healthy"
     except Exception as e:
         db_status = f"error: {str(e)}"
     
+    task_counts = task_manager.counts()
+    
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "database": db_status,
-        "active_tasks": len(task_manager.tasks),
-        "completed_tasks": len(task_manager.completed_tasks)
+        "active_tasks": task_counts["active"],
+        "queued_tasks": task_counts["queued"],
+        "completed_tasks": task_counts["completed"]
+    }
+
+
+@app.get("/pool-health", summary="Database pool statistics")
+async def pool_health():
+    """Connection pool usage statistics"""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "pool": db_pool.stats()
     }
 
 
@@ -273,11 +590,23 @@ async def scrape_url(
         raise e
     
     # Generate task ID
-    task_id = f"task_{int(time.time() * 1000)}"
+    task_id = f"task_{uuid.uuid4().hex}"
     
     # Create task
     task = task_manager.create_task(task_id, validated_url)
     
+    # Serve recent results without scraping again
+    if not request.force_rescrape:
+        cached_id = await find_cached_result(validated_url)
+        if cached_id:
+            task_manager.complete_task(task_id, result_id=cached_id)
+            return ScrapeResponse(
+                task_id=task_id,
+                status="cached",
+                message=f"Recent result available for {validated_url}",
+                result_id=cached_id
+            )
+    
     # Start background scraping
     background_tasks.add_task(
         perform_scraping,
@@ -287,12 +616,13 @@ async def scrape_url(
         request.config
     )
     
-    logger.info(f"Started scraping task {task_id} for {validated_url}")
+    queued = _scrape_sem.locked()
+    logger.info(f"{'Queued' if queued else 'Started'} scraping task {task_id} for {validated_url}")
     
     return ScrapeResponse(
         task_id=task_id,
-        status="started",
-        message=f"Scraping task started for {validated_url}",
+        status="queued" if queued else "started",
+        message=f"Scraping task {'queued' if queued else 'started'} for {validated_url}",
         estimated_completion=(datetime.now() + timedelta(seconds=30)).isoformat()
     )
 
@@ -313,72 +643,65 @@ async def list_results(
     limit: int = Query(50, ge=1, le=1000, description="Number of results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
     status: Optional[str] = Query(None, description="Filter by status (success/failed)"),
-    domain: Optional[str] = Query(None, description="Filter by domain")
+    domain: Optional[str] = Query(None, description="Filter by domain"),
+    cursor: Optional[str] = Query(None, description="Return results after this cursor (from next_cursor)"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="Response format (json/ndjson)")
 ):
-    """List scraping results with optional filtering"""
+    """
+    List scraping results with optional filtering.
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        # Build query
-        query = "SELECT * FROM scrape_results WHERE 1=1"
-        params = []
-        
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        
-        if domain:
-            query += " AND domain LIKE ?"
-            params.append(f"%{domain}%")
-        
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-        
-        cursor = conn.execute(query, params)
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        # Parse JSON fields
-        for result in results:
-            for field in ['data_json', 'links_json', 'images_json']:
-                if result.get(field):
-                    try:
-                        result[field.replace('_json', '')] = json.loads(result[field])
-                        del result[field]
-                    except json.JSONDecodeError:
-                        pass
+    Pass the returned next_cursor (or X-Next-Cursor header) as cursor to fetch
+    the following page; unlike offset, this does not rescan skipped rows.
+    format=ndjson streams one result per line.
+    """
+    
+    # Filter values, in the order list_results_sql places their placeholders
+    params = []
+    if status:
+        params.append(status)
+    if domain:
+        params.append(like_prefix(domain))
+    if cursor:
+        params.extend(parse_cursor(cursor))
+    
+    select_sql, key_sql = list_results_sql(bool(status), bool(domain), bool(cursor))
+    
+    if format == "ndjson":
+        # Key of the last row on this page, read without materializing the rows
+        last = await query_raw(key_sql, (*params, offset + limit - 1), one=True)
+        headers = {"X-Next-Cursor": make_cursor(*last)} if last else {}
         
-        return {
-            "results": results,
-            "count": len(results),
-            "limit": limit,
-            "offset": offset
-        }
+        return StreamingResponse(
+            stream_rows(select_sql, (*params, limit, offset)),
+            media_type="application/x-ndjson",
+            headers=headers
+        )
+    
+    results = await query_rows(select_sql, (*params, limit, offset))
+    
+    next_cursor = None
+    if len(results) == limit:
+        next_cursor = make_cursor(results[-1]["timestamp"], results[-1]["id"])
+    
+    return {
+        "results": results,
+        "count": len(results),
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor
+    }
 
 
 @app.get("/results/{result_id}", response_model=ScrapeResult, summary="Get specific result")
 async def get_result(result_id: int = PathParam(..., ge=1)):
     """Get a specific scraping result by ID"""
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        cursor = conn.execute("SELECT * FROM scrape_results WHERE id = ?", (result_id,))
-        row = cursor.fetchone()
-        
-        if not row:
-            raise HTTPException(status_code=404, detail="Result not found")
-        
-        columns = [desc[0] for desc in cursor.description]
-        result = dict(zip(columns, row))
-        
-        # Parse JSON fields
-        for field in ['data_json', 'links_json', 'images_json']:
-            if result.get(field):
-                try:
-                    result[field.replace('_json', '')] = json.loads(result[field])
-                    del result[field]
-                except json.JSONDecodeError:
-                    pass
-        
-        return result
+    result = await query_row("SELECT * FROM scrape_results WHERE id = ?", (result_id,))
+    
+    if not result:
+        raise HTTPException(status_code=404, detail="Result not found")
+    
+    return result
 
 
 @app.get("/results/url/{encoded_url}", summary="Get results for URL")
@@ -390,30 +713,25 @@ async def get_results_by_url(encoded_url: str):
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid URL encoding")
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        cursor = conn.execute(
-            "SELECT * FROM scrape_results WHERE url = ? OR url LIKE ? ORDER BY timestamp DESC",
-            (url, f"%{url}%")
-        )
-        
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        # Parse JSON fields
-        for result in results:
-            for field in ['data_json', 'links_json', 'images_json']:
-                if result.get(field):
-                    try:
-                        result[field.replace('_json', '')] = json.loads(result[field])
-                        del result[field]
-                    except json.JSONDecodeError:
-                        pass
-        
-        return {
-            "url": url,
-            "results": results,
-            "count": len(results)
-        }
+    results = await query_rows(
+        "SELECT * FROM scrape_results WHERE url = ? ORDER BY timestamp DESC",
+        (url,)
+    )
+    
+    # No exact match: fall back to a phrase search on the url column
+    if not results and url.split():
+        results = await query_rows("""
+            SELECT sr.* FROM scrape_fts
+            JOIN scrape_results sr ON sr.id = scrape_fts.rowid
+            WHERE scrape_fts MATCH ?
+            ORDER BY sr.timestamp DESC
+        """, ('url : "' + url.replace('"', '""') + '"',))
+    
+    return {
+        "url": url,
+        "results": results,
+        "count": len(results)
+    }
 
 
 @app.get("/results/domain/{domain}", summary="Get results for domain")
@@ -423,30 +741,23 @@ async def get_results_by_domain(
 ):
     """Get all results for a specific domain"""
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        cursor = conn.execute(
-            "SELECT * FROM scrape_results WHERE domain = ? OR domain LIKE ? ORDER BY timestamp DESC LIMIT ?",
-            (domain, f"%{domain}%", limit)
+    results = await query_rows(
+        "SELECT * FROM scrape_results WHERE domain = ? ORDER BY timestamp DESC LIMIT ?",
+        (domain, limit)
+    )
+    
+    # No exact match: fall back to an indexed prefix match
+    if not results:
+        results = await query_rows(
+            "SELECT * FROM scrape_results WHERE domain LIKE ? ESCAPE '\\' ORDER BY timestamp DESC LIMIT ?",
+            (like_prefix(domain), limit)
         )
-        
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        # Parse JSON fields
-        for result in results:
-            for field in ['data_json', 'links_json', 'images_json']:
-                if result.get(field):
-                    try:
-                        result[field.replace('_json', '')] = json.loads(result[field])
-                        del result[field]
-                    except json.JSONDecodeError:
-                        pass
-        
-        return {
-            "domain": domain,
-            "results": results,
-            "count": len(results)
-        }
+    
+    return {
+        "domain": domain,
+        "results": results,
+        "count": len(results)
+    }
 
 
 @app.get("/search", summary="Search results")
@@ -456,120 +767,90 @@ async def search_results(
 ):
     """Search through scraped content"""
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        cursor = conn.execute("""
-            SELECT * FROM scrape_results
-            WHERE title LIKE ? 
-               OR data_json LIKE ?
-               OR url LIKE ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (f"%{q}%", f"%{q}%", f"%{q}%", limit))
-        
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        # Parse JSON fields and calculate relevance
-        for result in results:
-            for field in ['data_json', 'links_json', 'images_json']:
-                if result.get(field):
-                    try:
-                        result[field.replace('_json', '')] = json.loads(result[field])
-                        del result[field]
-                    except json.JSONDecodeError:
-                        pass
-            
-            # Calculate relevance score
-            score = 0
-            if q.lower() in (result.get('title') or '').lower():
-                score += 10
-            if q.lower() in (result.get('url') or '').lower():
-                score += 5
-            if q.lower() in (result.get('data_json') or '').lower():
-                score += 1
-            
-            result['relevance_score'] = score
-        
-        # Sort by relevance
-        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
-        return {
-            "query": q,
-            "results": results,
-            "count": len(results)
-        }
+    match = fts_query(q)
+    if not match:
+        return {"query": q, "results": [], "count": 0}
+    
+    # bm25 column weights follow the scrape_fts column order: url, title, data
+    results = await query_rows("""
+        SELECT sr.*, -bm25(scrape_fts, 5.0, 10.0, 1.0) AS relevance_score
+        FROM scrape_fts
+        JOIN scrape_results sr ON sr.id = scrape_fts.rowid
+        WHERE scrape_fts MATCH ?
+        ORDER BY relevance_score DESC
+        LIMIT ?
+    """, (match, limit))
+    
+    return {
+        "query": q,
+        "results": results,
+        "count": len(results)
+    }
 
 
 @app.get("/stats", response_model=DatabaseStats, summary="Get statistics")
 async def get_statistics():
     """Get comprehensive database statistics"""
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        # Basic counts
-        total_results = conn.execute("SELECT COUNT(*) FROM scrape_results").fetchone()[0]
-        successful_results = conn.execute("SELECT COUNT(*) FROM scrape_results WHERE status = 'success'").fetchone()[0]
-        failed_results = conn.execute("SELECT COUNT(*) FROM scrape_results WHERE status = 'failed'").fetchone()[0]
-        
-        # Method statistics
-        method_stats = {}
-        method_cursor = conn.execute("""
+    # Counts and response times in one pass; grouped breakdowns run concurrently
+    totals, method_rows, domain_rows, recent_rows = await asyncio.gather(
+        query_raw("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(status = 'success'), 0),
+                   COALESCE(SUM(status = 'failed'), 0),
+                   AVG(response_time), MIN(response_time), MAX(response_time)
+            FROM scrape_results
+        """, one=True),
+        query_raw("""
             SELECT method_used, COUNT(*) as count, AVG(response_time) as avg_time
             FROM scrape_results
             WHERE method_used != 'none'
             GROUP BY method_used
-        """)
-        
-        for method, count, avg_time in method_cursor.fetchall():
-            method_stats[method] = {
-                'count': count,
-                'avg_response_time': round(avg_time or 0, 3)
-            }
-        
-        # Domain statistics
-        domain_cursor = conn.execute("""
+        """),
+        query_raw("""
             SELECT domain, COUNT(*) as count
             FROM scrape_results
             GROUP BY domain
             ORDER BY count DESC
             LIMIT 10
-        """)
-        
-        top_domains = dict(domain_cursor.fetchall())
-        
-        # Time-based statistics
-        recent_cursor = conn.execute("""
+        """),
+        query_raw("""
             SELECT DATE(timestamp) as date, COUNT(*) as count
             FROM scrape_results
             WHERE timestamp >= date('now', '-7 days')
             GROUP BY DATE(timestamp)
             ORDER BY date DESC
         """)
-        
-        daily_stats = dict(recent_cursor.fetchall())
-        
-        # Response time statistics
-        time_cursor = conn.execute("""
-            SELECT AVG(response_time) as avg, MIN(response_time) as min, MAX(response_time) as max
-            FROM scrape_results
-            WHERE response_time IS NOT NULL
-        """)
-        
-        time_stats = time_cursor.fetchone()
-        
-        return DatabaseStats(
-            total_results=total_results,
-            successful_results=successful_results,
-            failed_results=failed_results,
-            success_rate=round((successful_results / total_results * 100) if total_results > 0 else 0, 2),
-            method_statistics=method_stats,
-            top_domains=top_domains,
-            daily_activity=daily_stats,
-            response_time_stats={
-                'average': round(time_stats[0] or 0, 3),
-                'minimum': round(time_stats[1] or 0, 3),
-                'maximum': round(time_stats[2] or 0, 3)
-            }
-        )
+    )
+    
+    total_results, successful_results, failed_results = totals[:3]
+    time_stats = totals[3:]
+    
+    # Method statistics
+    method_stats = {}
+    for method, count, avg_time in method_rows:
+        method_stats[method] = {
+            'count': count,
+            'avg_response_time': round(avg_time or 0, 3)
+        }
+    
+    top_domains = dict(domain_rows)
+    daily_stats = dict(recent_rows)
+    
+    return DatabaseStats(
+        total_results=total_results,
+        successful_results=successful_results,
+        failed_results=failed_results,
+        success_rate=round((successful_results / total_results * 100) if total_results > 0 else 0, 2),
+        method_statistics=method_stats,
+        top_domains=top_domains,
+        daily_activity=daily_stats,
+        response_time_stats={
+            'average': round(time_stats[0] or 0, 3),
+            'minimum': round(time_stats[1] or 0, 3),
+            'maximum': round(time_stats[2] or 0, 3)
+        }
+    )
 
 
 @app.delete("/results/{result_id}", summary="Delete result")
@@ -579,54 +860,144 @@ async def delete_result(
 ):
     """Delete a specific scraping result"""
     
-    with sqlite3.connect(scraping_db.db_path) as conn:
-        cursor = conn.execute("DELETE FROM scrape_results WHERE id = ?", (result_id,))
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Result not found")
-        
-        conn.commit()
+    async with db_pool.get_conn(readonly=False) as conn:
+        deleted = await asyncio.to_thread(
+            lambda: conn.execute(
+                "DELETE FROM scrape_results WHERE id = ? RETURNING url", (result_id,)
+            ).fetchall()
+        )
+    
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Result not found")
+    
+    # Stop serving the deleted row as a cache hit for its URL
+    key = normalize_url(deleted[0][0])
+    cached = result_cache.get(key)
+    if cached and cached[0] == result_id:
+        result_cache.pop(key, None)
     
     return {"message": f"Result {result_id} deleted successfully"}
 
 
-# Background task function
-async def perform_scraping(task_id: str, url: str, methods: List[str], config: Dict[str, Any]):
-    """Perform the actual scraping in background"""
-    
+# Result writer
+INSERT_RETURNING_SQL = ScrapingDatabase.INSERT_SQL.rstrip() + " RETURNING id"
+
+
+def dumps_column(value: Any) -> str:
+    """Encode a JSON column with orjson (stored as TEXT so FTS can index it)"""
+    return orjson.dumps(value).decode()
+
+
+def write_batch(conn, results: List[Dict[str, Any]]) -> List[int]:
+    """Insert results in a single transaction, returning their row IDs"""
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        # Update task status
-        task_manager.update_task(task_id, status="running", started_at=datetime.now().isoformat())
-        
-        # 🔒 SECURITY CHECK: Ensure VPN is active before scraping
-        is_vpn_active, vpn_message, current_ip = await async_check_vpn()
-        if not is_vpn_active:
-            raise Exception(f"VPN CHECK FAILED: {vpn_message}")
-        
-        logger.info(f"VPN Check passed for task {task_id}: {current_ip}")
-        
-        # Create scraper with config
-        scraper_config = {
-            'verify_ssl': False,
-            'timeout': 30,
-            **config
-        }
-        
-        # Perform scraping
-        async with ProgressiveScraper(scraper_config) as scraper:
-            result = await scraper.scrape_progressive(url)
-        
-        # Save to database
-        result_id = scraping_db.save_result(result)
-        
-        # Mark task as completed
-        task_manager.complete_task(task_id, result_id=result_id)
+        result_ids = [
+            conn.execute(
+                INSERT_RETURNING_SQL,
+                ScrapingDatabase.result_params(result, dumps=dumps_column)
+            ).fetchone()[0]
+            for result in results
+        ]
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    
+    return result_ids
+
+
+async def writer_loop():
+    """Drain write_queue, committing queued results in batches"""
+    while True:
+        batch = [await write_queue.get()]
+        while not write_queue.empty() and len(batch) < WRITE_BATCH_SIZE:
+            batch.append(write_queue.get_nowait())
         
-        logger.info(f"Completed scraping task {task_id} with result ID {result_id}")
+        try:
+            async with db_pool.get_conn(readonly=False) as conn:
+                result_ids = await asyncio.to_thread(write_batch, conn, [result for result, _ in batch])
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} results: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result_id in zip(batch, result_ids):
+                if not future.done():
+                    future.set_result(result_id)
+        finally:
+            for _ in batch:
+                write_queue.task_done()
+
+
+async def save_result(result: Dict[str, Any]) -> int:
+    """Queue a result for the writer task and wait for its row ID"""
+    future = asyncio.get_running_loop().create_future()
+    await write_queue.put((result, future))
+    return await future
+
+
+async def check_vpn_cached():
+    """async_check_vpn, reusing a recent successful result"""
+    if _vpn_cache["active"] and time.monotonic() - _vpn_cache["ts"] < VPN_CHECK_TTL:
+        return True, _vpn_cache["msg"], _vpn_cache["ip"]
+    
+    async with _vpn_lock:
+        # Another task may have refreshed the check while we waited
+        if _vpn_cache["active"] and time.monotonic() - _vpn_cache["ts"] < VPN_CHECK_TTL:
+            return True, _vpn_cache["msg"], _vpn_cache["ip"]
         
-    except Exception as e:
-        logger.error(f"Scraping task {task_id} failed: {e}")
-        task_manager.complete_task(task_id, error=str(e))
+        is_vpn_active, vpn_message, current_ip = await async_check_vpn()
+        _vpn_cache.update(ts=time.monotonic(), active=is_vpn_active, msg=vpn_message, ip=current_ip)
+        return is_vpn_active, vpn_message, current_ip
+
+
+# Background task function
+async def perform_scraping(task_id: str, url: str, methods: List[str], config: Dict[str, Any]):
+    """Perform the actual scraping in background, at most MAX_CONCURRENT_SCRAPES at once"""
+    
+    async with _scrape_sem:
+        try:
+            # Update task status
+            task_manager.update_task(task_id, status="running", started_at=time.time())
+            
+            # 🔒 SECURITY CHECK: Ensure VPN is active before scraping
+            is_vpn_active, vpn_message, current_ip = await check_vpn_cached()
+            if not is_vpn_active:
+                raise Exception(f"VPN CHECK FAILED: {vpn_message}")
+            
+            logger.info(f"VPN Check passed for task {task_id}: {current_ip}")
+            
+            # Create scraper with config
+            scraper_config = {
+                'verify_ssl': False,
+                'timeout': 30,
+                **config
+            }
+            
+            # Perform scraping in a worker process, or in-process when workers are disabled
+            if scrape_executor:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    scrape_executor, scrape_worker.scrape, url, scraper_config
+                )
+            else:
+                result = await scrape_worker.scrape_async(url, scraper_config)
+            
+            # Save to database
+            result_id = await save_result(result)
+            
+            if result.get('status') == 'success':
+                result_cache[normalize_url(url)] = (result_id, time.time())
+            
+            # Mark task as completed
+            task_manager.complete_task(task_id, result_id=result_id)
+            
+            logger.info(f"Completed scraping task {task_id} with result ID {result_id}")
+            
+        except Exception as e:
+            logger.error(f"Scraping task {task_id} failed: {e}")
+            task_manager.complete_task(task_id, error=str(e))
 
 
 # CLI argument parsing for service
@@ -656,6 +1027,13 @@ def parse_service_arguments():
         help='Enable auto-reload for development'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=int(os.environ.get("API_WORKERS", 1)),
+        help='Uvicorn worker processes (default: 1; task status is tracked per worker)'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['debug', 'info', 'warning', 'error'],
@@ -674,6 +1052,7 @@ if __name__ == "__main__":
     print("=" * 50)
     print(f"Host: {args.host}")
     print(f"Port: {args.port}")
+    print(f"Workers: {args.workers}")
     print(f"Docs: http://{args.host}:{args.port}/docs")
     print("=" * 50)
     
@@ -683,5 +1062,8 @@ if __name__ == "__main__":
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
+        loop="uvloop" if HAS_UVLOOP else "asyncio",
+        http="httptools" if HAS_HTTPTOOLS else "h11",
         log_level=args.log_level
     )
\ No newline at end of file
@@ -1,6 +1,6 @@
 from .base import BaseModel
-from .scrape_request import ScrapeRequest
+from .scrape_request import ScrapeRequest, ScrapeRequestExternal
 from .scrape_result import ScrapeResult
 from .proxy_config import ProxyConfig
 
-__all__ = ["BaseModel", "ScrapeRequest", "ScrapeResult", "ProxyConfig"]
\ No newline at end of file
+__all__ = ["BaseModel", "ScrapeRequest", "ScrapeRequestExternal", "ScrapeResult", "ProxyConfig"]
\ No newline at end of file
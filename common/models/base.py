@@ -1,6 +1,8 @@
+import copy
 from datetime import datetime
-from typing import Any, Dict, Optional
-from pydantic import BaseModel as PydanticBaseModel, Field
+from enum import Enum
+from typing import Annotated, Any, ClassVar, Dict, List, Mapping, NoReturn, Optional, Self, Type, cast
+from pydantic import BaseModel as PydanticBaseModel, BeforeValidator, ConfigDict, Field, HttpUrl, TypeAdapter
 
 try:
     from bson import ObjectId
@@ -10,19 +12,132 @@ except ImportError:
     ObjectId = str
 
 
-class ObjectIdStr(str):
-    """Custom type for MongoDB ObjectId that serializes to string"""
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+if HAS_BSON:
+    # MongoDB ObjectId accepted as input, stored and serialized as a string
+    ObjectIdStr = Annotated[str, BeforeValidator(lambda v: str(v) if isinstance(v, ObjectId) else v)]
+else:
+    ObjectIdStr = str  # type: ignore[misc]
+
+
+# Shared HttpUrl validator for models that opt into URL validation
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+def validate_url_field(value: Any, validate: bool) -> Any:
+    """Coerce a URL field to str, fully validating it as an HttpUrl when validate is set"""
+    if value is None:
+        return None
+    if validate:
+        return str(_HTTP_URL.validate_python(value))
+    return value if isinstance(value, str) else str(value)
+
+
+def _read_only() -> NoReturn:
+    raise TypeError("shared empty default is read-only; build a new value and use model_copy(update=...)")
+
+
+class _FrozenEmptyDict(Dict[str, Any]):
+    """Empty dict shared as the default of frozen models' dict fields"""
+    __slots__ = ()
+    
+    def __setitem__(self, key: str, value: Any) -> NoReturn:
+        _read_only()
+    
+    def __delitem__(self, key: str) -> NoReturn:
+        _read_only()
+    
+    def __ior__(self, other: Any) -> NoReturn:  # type: ignore[misc]
+        _read_only()
+    
+    def clear(self) -> NoReturn:
+        _read_only()
+    
+    def pop(self, *args: Any) -> NoReturn:
+        _read_only()
+    
+    def popitem(self) -> NoReturn:
+        _read_only()
+    
+    def setdefault(self, *args: Any) -> NoReturn:
+        _read_only()
+    
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn:
+        _read_only()
+    
+    # Pydantic deep-copies defaults; the shared instance is its own copy
+    def __copy__(self) -> "_FrozenEmptyDict":
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_FrozenEmptyDict":
+        return self
+    
+    def __reduce__(self) -> str:
+        return "EMPTY_DICT"
+
+
+class _FrozenEmptyList(List[Any]):
+    """Empty list shared as the default of frozen models' list fields"""
+    __slots__ = ()
+    
+    def __setitem__(self, index: Any, value: Any) -> NoReturn:
+        _read_only()
+    
+    def __delitem__(self, index: Any) -> NoReturn:
+        _read_only()
+    
+    def __iadd__(self, other: Any) -> NoReturn:  # type: ignore[misc]
+        _read_only()
+    
+    def __imul__(self, count: Any) -> NoReturn:  # type: ignore[misc]
+        _read_only()
+    
+    def append(self, item: Any) -> NoReturn:
+        _read_only()
+    
+    def extend(self, items: Any) -> NoReturn:
+        _read_only()
+    
+    def insert(self, index: Any, item: Any) -> NoReturn:
+        _read_only()
+    
+    def remove(self, item: Any) -> NoReturn:
+        _read_only()
+    
+    def pop(self, *args: Any) -> NoReturn:
+        _read_only()
+    
+    def clear(self) -> NoReturn:
+        _read_only()
+    
+    def sort(self, *args: Any, **kwargs: Any) -> NoReturn:
+        _read_only()
+    
+    def reverse(self) -> NoReturn:
+        _read_only()
+    
+    def __copy__(self) -> "_FrozenEmptyList":
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_FrozenEmptyList":
+        return self
+    
+    def __reduce__(self) -> str:
+        return "EMPTY_LIST"
+
+
+# Defaults for container fields of frozen models: one shared read-only
+# instance instead of a fresh dict()/list() per model
+EMPTY_DICT: Dict[str, Any] = _FrozenEmptyDict()
+EMPTY_LIST: List[Any] = _FrozenEmptyList()
+
+
+class CoercibleEnum(Enum):
+    """Enum base whose coerce classmethod maps a member or its value to the member"""
     
     @classmethod
-    def validate(cls, v):
-        if HAS_BSON and isinstance(v, ObjectId):
-            return str(v)
-        if isinstance(v, str):
-            return v
-        raise ValueError("Invalid ObjectId")
+    def coerce(cls, value: Any) -> Self:
+        """Member for a member or its value, via the enum's own O(1) value lookup"""
+        return value if value.__class__ is cls else cast(Self, cls._value2member_map_[value])
 
 
 class BaseModel(PydanticBaseModel):
@@ -33,10 +148,35 @@ class BaseModel(PydanticBaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
+    
+    # model_json_schema results per (class, arguments); schemas are static per class
+    _json_schema_cache: ClassVar[Dict[Any, Dict[str, Any]]] = {}
+    
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """JSON schema for the model, generated once per class and arguments"""
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        schema = BaseModel._json_schema_cache.get(key)
+        if schema is None:
+            schema = BaseModel._json_schema_cache[key] = super().model_json_schema(*args, **kwargs)
+        return copy.deepcopy(schema)
+    
+    @classmethod
+    def _construct_trusted(cls, data: Dict[str, Any], enum_fields: Mapping[str, Type[CoercibleEnum]]) -> Self:
+        """Build without validation, coercing enum_fields values to members"""
+        data = dict(data)
+        for field, enum_cls in enum_fields.items():
+            value = data.get(field)
+            if value is not None:
+                data[field] = enum_cls.coerce(value)
+        # Timestamps arrive as ISO strings once data has been through JSON
+        for field in ("created_at", "updated_at"):
+            value = data.get(field)
+            if type(value) is str:
+                data[field] = datetime.fromisoformat(value)
+        return cls.model_construct(**data)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary for MongoDB storage"""
-        return self.dict(by_alias=True, exclude_none=True)
\ No newline at end of file
+        return self.model_dump(by_alias=True, exclude_none=True, mode='json')
\ No newline at end of file
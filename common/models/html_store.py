@@ -0,0 +1,94 @@
+"""
+Content-addressed store for page HTML taken out of ScrapeResults.
+
+Blobs live on the local filesystem, so a raw_html_ref only resolves on the host
+that stored it: results sent to another machine must carry their HTML inline
+(ScrapeResult.with_inline_html). Blobs are not reference-counted; prune_html
+removes those not stored again within SCRAPER_HTML_STORE_MAX_AGE seconds.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+def _store_dir() -> Path:
+    """Directory holding stored page HTML (SCRAPER_HTML_STORE, default <tmp>/scraper_html_store)"""
+    configured = os.environ.get("SCRAPER_HTML_STORE")
+    if configured:
+        return Path(configured).resolve()
+    return Path(tempfile.gettempdir()) / "scraper_html_store"
+
+
+def _max_age() -> float:
+    """Seconds a blob is kept after it was last stored (SCRAPER_HTML_STORE_MAX_AGE, default 7 days)"""
+    return float(os.environ.get("SCRAPER_HTML_STORE_MAX_AGE", 7 * 24 * 3600))
+
+
+def _blob_path(ref: str) -> Path:
+    return _store_dir() / ref[:2] / f"{ref}.html"
+
+
+def store_html(html: str) -> str:
+    """Write html under its content hash and return the reference key (blocking file I/O)"""
+    data = html.encode("utf-8")
+    ref = hashlib.sha1(data).hexdigest()
+    path = _blob_path(ref)
+
+    # Content-addressed: an existing blob already holds these bytes, so only
+    # refresh its mtime to keep it out of prune_html's reach
+    if path.exists():
+        try:
+            os.utime(path)
+            return ref
+        except FileNotFoundError:
+            pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return ref
+
+
+def load_html(ref: str) -> Optional[str]:
+    """Read stored html by reference key, or None if it is missing"""
+    try:
+        return _blob_path(ref).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def delete_html(ref: str) -> bool:
+    """Remove a stored blob; False if it was already gone"""
+    try:
+        _blob_path(ref).unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def prune_html(max_age: Optional[float] = None) -> int:
+    """Remove blobs not written or re-stored in the last max_age seconds (default SCRAPER_HTML_STORE_MAX_AGE), returning the count"""
+    cutoff = time.time() - (_max_age() if max_age is None else max_age)
+    removed = 0
+    for path in _store_dir().glob("*/*.html"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
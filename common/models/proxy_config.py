@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import Field, validator
+from pydantic import ConfigDict, Field, validator
 from .base import BaseModel
 
 
@@ -105,20 +105,19 @@ class ProxyConfig(BaseModel):
         else:
             self.health_score = max(0.0, self.health_score - 0.05)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "host": "proxy.privateinternetaccess.com",
-                "port": 1080,
-                "proxy_type": "socks5",
-                "provider": "pia",
-                "username": "username",
-                "password": "password",
-                "country": "US",
-                "region": "California",
-                "city": "Los Angeles",
-                "status": "active",
-                "health_score": 0.95,
-                "success_rate": 0.98
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "host": "proxy.privateinternetaccess.com",
+            "port": 1080,
+            "proxy_type": "socks5",
+            "provider": "pia",
+            "username": "username",
+            "password": "password",
+            "country": "US",
+            "region": "California",
+            "city": "Los Angeles",
+            "status": "active",
+            "health_score": 0.95,
+            "success_rate": 0.98
+        }
+    })
\ No newline at end of file
@@ -1,17 +1,17 @@
-from enum import Enum
-from typing import Dict, List, Optional, Any
-from pydantic import Field, HttpUrl
-from .base import BaseModel
+import sys
+from typing import ClassVar, Dict, List, Optional, Any, Tuple, Type
+from pydantic import BaseModel as PydanticBaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from .base import EMPTY_DICT, EMPTY_LIST, BaseModel, CoercibleEnum, validate_url_field
 
 
-class ScrapeMethod(str, Enum):
+class ScrapeMethod(str, CoercibleEnum):
     """Scraping method to use"""
     SCRAPY = "scrapy"
     PYDOLL = "pydoll"  # Using httpx + selectolax
     PLAYWRIGHT = "playwright"
 
 
-class AuthType(str, Enum):
+class AuthType(str, CoercibleEnum):
     """Authentication type"""
     NONE = "none"
     BASIC = "basic"
@@ -21,7 +21,7 @@ class AuthType(str, Enum):
     CUSTOM = "custom"
 
 
-class Priority(str, Enum):
+class Priority(str, CoercibleEnum):
     """Request priority"""
     LOW = "low"
     NORMAL = "normal"
@@ -29,10 +29,23 @@ class Priority(str, Enum):
     URGENT = "urgent"
 
 
+# (keys, values) form of a string map, used by ScrapeRequestPacked
+PackedPairs = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+_EMPTY_PAIRS: PackedPairs = ((), ())
+
+# Enum fields coerced when constructing from trusted data
+_ENUM_FIELDS: Dict[str, Type[CoercibleEnum]] = {
+    "method": ScrapeMethod,
+    "priority": Priority,
+    "auth_type": AuthType,
+}
+
+
 class ScrapeRequest(BaseModel):
     """Model for scraping requests"""
     
-    url: HttpUrl = Field(..., description="Target URL to scrape")
+    url: str = Field(..., description="Target URL to scrape")
     method: ScrapeMethod = Field(default=ScrapeMethod.SCRAPY, description="Scraping method")
     priority: Priority = Field(default=Priority.NORMAL, description="Request priority")
     
@@ -41,12 +54,12 @@ class ScrapeRequest(BaseModel):
     auth_credentials: Optional[Dict[str, str]] = Field(default=None, description="Auth credentials")
     
     # Headers and cookies
-    headers: Dict[str, str] = Field(default_factory=dict, description="HTTP headers")
-    cookies: Dict[str, str] = Field(default_factory=dict, description="HTTP cookies")
+    headers: Dict[str, str] = Field(default=EMPTY_DICT, description="HTTP headers")
+    cookies: Dict[str, str] = Field(default=EMPTY_DICT, description="HTTP cookies")
     
     # Scraping configuration
-    selectors: Dict[str, str] = Field(default_factory=dict, description="CSS/XPath selectors")
-    wait_conditions: List[str] = Field(default_factory=list, description="Wait conditions for dynamic content")
+    selectors: Dict[str, str] = Field(default=EMPTY_DICT, description="CSS/XPath selectors")
+    wait_conditions: List[str] = Field(default=EMPTY_LIST, description="Wait conditions for dynamic content")
     timeout: int = Field(default=30, description="Request timeout in seconds")
     
     # Proxy configuration
@@ -67,13 +80,58 @@ class ScrapeRequest(BaseModel):
     extract_text: bool = Field(default=True, description="Extract text content")
     
     # Callback configuration
-    callback_url: Optional[HttpUrl] = Field(default=None, description="Webhook URL for results")
+    callback_url: Optional[str] = Field(default=None, description="Webhook URL for results")
     
     # Custom configuration
-    custom_config: Dict[str, Any] = Field(default_factory=dict, description="Custom configuration")
+    custom_config: Dict[str, Any] = Field(default=EMPTY_DICT, description="Custom configuration")
+    
+    # URLs are only parsed as HttpUrl where input comes from outside (ScrapeRequestExternal)
+    _VALIDATE_URLS: ClassVar[bool] = False
+    
+    @field_validator("url", "callback_url", mode="before")
+    @classmethod
+    def _check_url(cls, value: Any) -> Any:
+        return validate_url_field(value, cls._VALIDATE_URLS)
+    
+    @classmethod
+    def parse_many(cls, raw: bytes) -> List["ScrapeRequest"]:
+        """Validate a JSON array of requests in a single pass"""
+        return _REQUESTS_ADAPTER.validate_json(raw)
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ScrapeRequest":
+        """Build from data we produced ourselves (queue payloads, DB rows, cache hits) without validation"""
+        return cls._construct_trusted(data, _ENUM_FIELDS)
+    
+    def to_field_dict(self) -> Dict[str, Any]:
+        """Raw field values by name, skipping model_dump; round-trips through from_trusted"""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+    
+    def to_packed(self) -> "ScrapeRequestPacked":
+        """Queue transport form with headers/cookies/selectors packed as (keys, values)"""
+        fields = self.to_field_dict()
+        packed: Dict[str, Any] = {}
+        for name in ScrapeRequestPacked.PACKED_FIELDS:
+            mapping = fields.pop(name)
+            packed[name] = (tuple(mapping), tuple(mapping.values())) if mapping else _EMPTY_PAIRS
+        return ScrapeRequestPacked.model_construct(fields=fields, **packed)
+    
+    @classmethod
+    def from_packed(cls, packed: "ScrapeRequestPacked") -> "ScrapeRequest":
+        """Rebuild a request from its packed transport form"""
+        data = dict(packed.fields)
+        for name in ScrapeRequestPacked.PACKED_FIELDS:
+            keys, values = getattr(packed, name)
+            data[name] = dict(zip(keys, values))
+        return cls.from_trusted(data)
     
-    class Config:
-        json_schema_extra = {
+    # Immutable once built; unknown fields are rejected rather than stored
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "method": "scrapy",
@@ -88,4 +146,30 @@ class ScrapeRequest(BaseModel):
                 "use_stealth": True,
                 "timeout": 30
             }
-        }
\ No newline at end of file
+        }
+    )
+
+
+# Interned field names for the to_field_dict fast path
+_FIELD_NAMES = tuple(sys.intern(name) for name in ScrapeRequest.model_fields)
+
+# Compiled once; validates whole batches without per-item Python dispatch
+_REQUESTS_ADAPTER: TypeAdapter[List[ScrapeRequest]] = TypeAdapter(List[ScrapeRequest])
+
+
+class ScrapeRequestPacked(PydanticBaseModel):
+    """ScrapeRequest transport form: string maps stored as parallel key/value tuples"""
+    
+    PACKED_FIELDS: ClassVar[Tuple[str, ...]] = ("headers", "cookies", "selectors")
+    
+    fields: Dict[str, Any] = Field(default_factory=dict, description="All other ScrapeRequest fields")
+    headers: PackedPairs = Field(default=_EMPTY_PAIRS, description="HTTP headers as (names, values)")
+    cookies: PackedPairs = Field(default=_EMPTY_PAIRS, description="HTTP cookies as (names, values)")
+    selectors: PackedPairs = Field(default=_EMPTY_PAIRS, description="Selectors as (names, selectors)")
+    
+    model_config = ConfigDict(frozen=True)
+
+class ScrapeRequestExternal(ScrapeRequest):
+    """ScrapeRequest received from users or other untrusted sources; URLs are validated"""
+    
+    _VALIDATE_URLS: ClassVar[bool] = True
@@ -1,10 +1,23 @@
-from enum import Enum
-from typing import Dict, List, Optional, Any
-from pydantic import Field, HttpUrl
-from .base import BaseModel
+import sys
+from typing import ClassVar, Dict, List, Optional, Any, Tuple, Type
+from pydantic import BaseModel as PydanticBaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, TypeAdapter, field_validator, model_serializer, model_validator
+from .base import EMPTY_DICT, EMPTY_LIST, BaseModel, CoercibleEnum, validate_url_field
+from .html_store import load_html, store_html as _store_html
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-class ScrapeStatus(str, Enum):
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+class ScrapeStatus(str, CoercibleEnum):
     """Scraping status"""
     PENDING = "pending"
     RUNNING = "running"
@@ -15,6 +28,85 @@ class ScrapeStatus(str, Enum):
     RATE_LIMITED = "rate_limited"
 
 
+# Small-int status codes for the msgpack transport, in declaration order
+_STATUS_TO_INT = {member: index for index, member in enumerate(ScrapeStatus)}
+_INT_TO_STATUS = tuple(ScrapeStatus)
+
+
+# Enum fields coerced when constructing from trusted data
+_ENUM_FIELDS: Dict[str, Type[CoercibleEnum]] = {
+    "status": ScrapeStatus,
+}
+
+
+class ScrapeResultDetail(PydanticBaseModel):
+    """Bulky, mostly-empty parts of a result, attached only when there is something to carry"""
+    
+    response_headers: Dict[str, str] = Field(default=EMPTY_DICT, description="Response headers")
+    raw_html: Optional[str] = Field(default=None, description="Inline raw HTML, until moved to the HTML store")
+    raw_html_ref: Optional[str] = Field(default=None, description="Host-local stored raw HTML reference (see store_html)")
+    links: List[str] = Field(default=EMPTY_LIST, description="Extracted links")
+    images: List[str] = Field(default=EMPTY_LIST, description="Extracted image URLs")
+    error_message: Optional[str] = Field(default=None, description="Error message if failed")
+    stack_trace: Optional[str] = Field(default=None, description="Stack trace for debugging")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+# Fields accepted at the top level of ScrapeResult input but stored on its detail
+_DETAIL_FIELDS = frozenset(ScrapeResultDetail.model_fields)
+
+
+def _split_detail(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of result input with detail fields moved under the "detail" key"""
+    data = dict(data)
+    detail = {name: data.pop(name) for name in _DETAIL_FIELDS.intersection(data)}
+    
+    # Only non-empty values are worth a detail object
+    detail = {name: value for name, value in detail.items() if value}
+    if detail:
+        data["detail"] = detail
+    return data
+
+
+def split_extracted_data(extracted: Dict[str, Any]) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+    """Split selector output into string values (data) and everything else (data_extra, None if empty)"""
+    data = {}
+    extra = None
+    for key, value in extracted.items():
+        if value.__class__ is str:
+            data[key] = value
+        else:
+            if extra is None:
+                extra = {}
+            extra[key] = value
+    return data, extra
+
+
+def _split_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of result input with non-string data values moved into data_extra"""
+    data = dict(data)
+    strings, extra = split_extracted_data(data["data"])
+    data["data"] = strings
+    if extra:
+        data["data_extra"] = {**(data.get("data_extra") or {}), **extra}
+    return data
+
+
+def _has_non_str_data(data: Dict[str, Any]) -> bool:
+    values = data.get("data")
+    if not values:
+        return False
+    return any(value.__class__ is not str for value in values.values())
+
+
+def _flatten_detail(data: Dict[str, Any], detail: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge non-empty detail values into a serialized result"""
+    if detail:
+        data.update((name, value) for name, value in detail.items() if value)
+    return data
+
+
 class ScrapeResult(BaseModel):
     """Model for scraping results"""
     
@@ -23,21 +115,19 @@ class ScrapeResult(BaseModel):
     
     # Response details
     status_code: Optional[int] = Field(default=None, description="HTTP status code")
-    response_headers: Dict[str, str] = Field(default_factory=dict, description="Response headers")
     response_time: Optional[float] = Field(default=None, description="Response time in seconds")
     
-    # Extracted data
-    data: Dict[str, Any] = Field(default_factory=dict, description="Extracted data")
-    raw_html: Optional[str] = Field(default=None, description="Raw HTML content")
-    
-    # Links and media
-    links: List[str] = Field(default_factory=list, description="Extracted links")
-    images: List[str] = Field(default_factory=list, description="Extracted image URLs")
+    # Extracted data: selector text in data, structured values (lists, numbers,
+    # parsed JSON, missing fields as None) in data_extra
+    data: Dict[str, str] = Field(default=EMPTY_DICT, description="Extracted text values")
+    data_extra: Optional[Dict[str, Any]] = Field(default=None, description="Extracted non-text values")
     
     # Error information
-    error_message: Optional[str] = Field(default=None, description="Error message if failed")
     error_type: Optional[str] = Field(default=None, description="Error type")
-    stack_trace: Optional[str] = Field(default=None, description="Stack trace for debugging")
+    
+    # Headers, raw HTML, links/images and error text; None when all are empty.
+    # Accepted and serialized as top-level keys, readable as properties.
+    detail: Optional[ScrapeResultDetail] = Field(default=None, description="Bulky result details")
     
     # Proxy information
     proxy_used: Optional[str] = Field(default=None, description="Proxy used for request")
@@ -49,14 +139,184 @@ class ScrapeResult(BaseModel):
     
     # Retry information
     retry_count: int = Field(default=0, description="Number of retries attempted")
-    final_url: Optional[HttpUrl] = Field(default=None, description="Final URL after redirects")
+    final_url: Optional[str] = Field(default=None, description="Final URL after redirects")
     
     # Quality metrics
     success_score: Optional[float] = Field(default=None, description="Success score (0-1)")
     data_completeness: Optional[float] = Field(default=None, description="Data completeness score")
     
-    class Config:
-        json_schema_extra = {
+    # final_url comes from our own HTTP clients, so it is not re-parsed by default
+    _VALIDATE_URLS: ClassVar[bool] = False
+    
+    @field_validator("request_id")
+    @classmethod
+    def _intern_request_id(cls, value: str) -> str:
+        # Results are deduplicated by request_id; interned ids compare by pointer
+        return sys.intern(value)
+    
+    @field_validator("final_url", mode="before")
+    @classmethod
+    def _check_url(cls, value: Any) -> Any:
+        return validate_url_field(value, cls._VALIDATE_URLS)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_input(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        
+        if not _DETAIL_FIELDS.isdisjoint(data):
+            data = _split_detail(data)
+        if _has_non_str_data(data):
+            data = _split_data(data)
+        return data
+    
+    @model_serializer(mode="wrap")
+    def _serialize_flat(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        data = handler(self)
+        return _flatten_detail(data, data.pop("detail", None))
+    
+    @property
+    def response_headers(self) -> Dict[str, str]:
+        return self.detail.response_headers if self.detail else EMPTY_DICT
+    
+    @property
+    def raw_html_ref(self) -> Optional[str]:
+        return self.detail.raw_html_ref if self.detail else None
+    
+    @property
+    def links(self) -> List[str]:
+        return self.detail.links if self.detail else EMPTY_LIST
+    
+    @property
+    def images(self) -> List[str]:
+        return self.detail.images if self.detail else EMPTY_LIST
+    
+    @property
+    def error_message(self) -> Optional[str]:
+        return self.detail.error_message if self.detail else None
+    
+    @property
+    def stack_trace(self) -> Optional[str]:
+        return self.detail.stack_trace if self.detail else None
+    
+    def __eq__(self, other: Any) -> bool:
+        # A result is identified by its request; comparing every field (HTML
+        # refs, header maps, data) made dedup and merge steps needlessly slow.
+        # Results of id-less requests (request_id "") are only equal to themselves.
+        if not isinstance(other, ScrapeResult):
+            return NotImplemented
+        if not self.request_id:
+            return self is other
+        return self.request_id is other.request_id or self.request_id == other.request_id
+    
+    def __hash__(self) -> int:
+        return hash(self.request_id) if self.request_id else id(self)
+    
+    def get_value(self, key: str, default: Any = None) -> Any:
+        """Extracted value for key from data, falling back to data_extra"""
+        if key in self.data:
+            return self.data[key]
+        return self.data_extra.get(key, default) if self.data_extra else default
+    
+    @property
+    def raw_html(self) -> Optional[str]:
+        """Raw HTML content, inline or loaded from the HTML store on access (None if the blob is not on this host)"""
+        if self.detail is None:
+            return None
+        if self.detail.raw_html is not None:
+            return self.detail.raw_html
+        return load_html(self.detail.raw_html_ref) if self.detail.raw_html_ref else None
+    
+    def store_html(self) -> "ScrapeResult":
+        """
+        Copy with inline raw HTML moved to the HTML store, leaving only its key.
+        
+        Writes to disk, so async callers should run it via asyncio.to_thread.
+        """
+        if self.detail is None or self.detail.raw_html is None:
+            return self
+        ref = _store_html(self.detail.raw_html)
+        detail = self.detail.model_copy(update={"raw_html": None, "raw_html_ref": ref})
+        return self.model_copy(update={"detail": detail})
+    
+    def with_inline_html(self) -> Dict[str, Any]:
+        """JSON-ready dict including the raw HTML, for transports that need it inline"""
+        data = self.model_dump(mode="json")
+        data["raw_html"] = self.raw_html
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        """Encode the result's fields as JSON bytes, bypassing pydantic's serializer when orjson is available"""
+        if HAS_ORJSON:
+            data = dict(self.__dict__)
+            detail = data.pop("detail")
+            _flatten_detail(data, detail.__dict__ if detail else None)
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return self.model_dump_json().encode()
+    
+    def to_msgpack(self) -> bytes:
+        """
+        Encode as a positional msgpack array for queue transport.
+        
+        Values are packed in field-declaration order without keys, so both ends
+        must run the same model version.
+        """
+        if not HAS_MSGPACK:
+            raise RuntimeError("msgpack is not installed")
+        
+        values = [getattr(self, name) for name in _FIELD_NAMES]
+        values[_STATUS_POS] = _STATUS_TO_INT[self.status]
+        values[_CREATED_POS] = self.created_at.isoformat()
+        values[_UPDATED_POS] = self.updated_at.isoformat()
+        if self.detail is not None:
+            values[_DETAIL_POS] = [getattr(self.detail, name) for name in _DETAIL_NAMES]
+        packed: bytes = msgpack.packb(values, default=str)
+        return packed
+    
+    @classmethod
+    def from_msgpack(cls, raw: bytes) -> "ScrapeResult":
+        """Decode a result packed by to_msgpack, without validation"""
+        if not HAS_MSGPACK:
+            raise RuntimeError("msgpack is not installed")
+        
+        data = dict(zip(_FIELD_NAMES, msgpack.unpackb(raw)))
+        data["status"] = _INT_TO_STATUS[data["status"]]
+        data["request_id"] = sys.intern(data["request_id"])
+        detail = data["detail"]
+        if detail is not None:
+            data["detail"] = ScrapeResultDetail.model_construct(**dict(zip(_DETAIL_NAMES, detail)))
+        return cls._construct_trusted(data, _ENUM_FIELDS)
+    
+    @classmethod
+    def parse_many(cls, raw: bytes) -> List["ScrapeResult"]:
+        """Validate a JSON array of results in a single pass"""
+        return _RESULTS_ADAPTER.validate_json(raw)
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ScrapeResult":
+        """Build from data we produced ourselves (queue payloads, DB rows, cache hits) without validation"""
+        if not _DETAIL_FIELDS.isdisjoint(data):
+            data = _split_detail(data)
+        if _has_non_str_data(data):
+            data = _split_data(data)
+        if data.get("request_id").__class__ is str:
+            data = {**data, "request_id": sys.intern(data["request_id"])}
+        if isinstance(data.get("detail"), dict):
+            data["detail"] = ScrapeResultDetail.model_construct(**data["detail"])
+        return cls._construct_trusted(data, _ENUM_FIELDS)
+    
+    def to_field_dict(self) -> Dict[str, Any]:
+        """Raw field values by name, skipping model_dump; round-trips through from_trusted"""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+    
+    # Immutable once built; unknown fields are rejected rather than stored
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        json_schema_extra={
             "example": {
                 "request_id": "64a1b2c3d4e5f6789012345",
                 "status": "success",
@@ -70,4 +330,19 @@ class ScrapeResult(BaseModel):
                 "proxy_used": "192.168.1.100:8080",
                 "success_score": 0.95
             }
-        }
\ No newline at end of file
+        }
+    )
+
+
+# Interned field names for the to_field_dict fast path
+_FIELD_NAMES = tuple(sys.intern(name) for name in ScrapeResult.model_fields)
+
+# Positional layout of the msgpack transport
+_DETAIL_NAMES = tuple(ScrapeResultDetail.model_fields)
+_STATUS_POS = _FIELD_NAMES.index("status")
+_DETAIL_POS = _FIELD_NAMES.index("detail")
+_CREATED_POS = _FIELD_NAMES.index("created_at")
+_UPDATED_POS = _FIELD_NAMES.index("updated_at")
+
+# Compiled once; validates whole batches without per-item Python dispatch
+_RESULTS_ADAPTER: TypeAdapter[List[ScrapeResult]] = TypeAdapter(List[ScrapeResult])
@@ -22,298 +22,594 @@ Features:
 
 import argparse
 import json
+import os
 import sqlite3
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import csv
 from urllib.parse import urlparse
 import re
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# JSON codec for stored columns and exports; orjson.JSONDecodeError subclasses json's
+def _json_default(obj: Any) -> Any:
+    """JSON fallback: sqlite3.Row as a dict, anything else as its string"""
+    if isinstance(obj, sqlite3.Row):
+        return dict(obj)
+    return str(obj)
+
+
+if HAS_ORJSON:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default)
+    
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=_json_default, ensure_ascii=False).encode('utf-8')
+
+
+# Stored JSON columns, exposed parsed under the name without the suffix
+_JSON_FIELDS = (('data_json', 'data'), ('links_json', 'links'), ('images_json', 'images'))
+
+
+# Columns for list views: everything but the JSON blobs (data/links/images)
+_LIST_COLUMNS = (
+    "id, url, domain, method_used, status, status_code, response_time, timestamp, "
+    "title, content_length, links_count, images_count"
+)
+_LIST_COLUMNS_R = ", ".join(f"r.{column}" for column in _LIST_COLUMNS.split(", "))
+
+
+def prefix_bounds(prefix: str) -> Tuple[str, str]:
+    """(low, high) such that low <= value < high holds exactly for values starting with prefix"""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def fts_query(search_term: str) -> str:
+    """Build an FTS5 MATCH expression matching every word of search_term as a prefix"""
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in search_term.split())
+
 
 class DataRetriever:
     """Database interface for retrieving scraped data"""
     
+    # Applied once to the retriever's connection
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+    )
+    
+    # Same external-content index master_scraper.py creates; kept in sync by triggers
+    FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS scrape_fts USING fts5(
+            url, title, data_json,
+            content='scrape_results', content_rowid='id',
+            tokenize='porter unicode61'
+        );
+        
+        CREATE TRIGGER IF NOT EXISTS scrape_fts_insert AFTER INSERT ON scrape_results BEGIN
+            INSERT INTO scrape_fts(rowid, url, title, data_json)
+            VALUES (new.id, new.url, new.title, new.data_json);
+        END;
+        
+        CREATE TRIGGER IF NOT EXISTS scrape_fts_delete AFTER DELETE ON scrape_results BEGIN
+            INSERT INTO scrape_fts(scrape_fts, rowid, url, title, data_json)
+            VALUES ('delete', old.id, old.url, old.title, old.data_json);
+        END;
+        
+        CREATE TRIGGER IF NOT EXISTS scrape_fts_update AFTER UPDATE OF url, title, data_json ON scrape_results BEGIN
+            INSERT INTO scrape_fts(scrape_fts, rowid, url, title, data_json)
+            VALUES ('delete', old.id, old.url, old.title, old.data_json);
+            INSERT INTO scrape_fts(rowid, url, title, data_json)
+            VALUES (new.id, new.url, new.title, new.data_json);
+        END;
+    """
+    
+    # Integer copy of timestamp for range filters: timestamp text is read as UTC
+    # wall-clock time, so cutoffs are built the same way (see _epoch)
+    EPOCH_SCHEMA = """
+        -- Only content changes need re-indexing; the ts_epoch backfill and fill-in
+        -- must not churn the FTS table (init_fts recreates it as UPDATE OF ...)
+        DROP TRIGGER IF EXISTS scrape_fts_update;
+        
+        ALTER TABLE scrape_results ADD COLUMN ts_epoch INTEGER;
+        UPDATE scrape_results SET ts_epoch = CAST(strftime('%s', timestamp) AS INTEGER);
+        CREATE INDEX IF NOT EXISTS idx_ts_epoch ON scrape_results(ts_epoch DESC);
+        
+        CREATE TRIGGER IF NOT EXISTS scrape_ts_epoch AFTER INSERT ON scrape_results BEGIN
+            UPDATE scrape_results SET ts_epoch = CAST(strftime('%s', new.timestamp) AS INTEGER)
+            WHERE id = new.id;
+        END;
+    """
+    
+    # Rows removed per cleanup transaction: bounds WAL growth and lets readers in between batches
+    CLEANUP_BATCH = 10000
+    
     def __init__(self, db_path: str = "scraped_data.db"):
         self.db_path = db_path
         if not Path(db_path).exists():
             print(f"❌ Database not found: {db_path}")
             print("💡 Run master_scraper.py first to create data")
             sys.exit(1)
+        
+        # One connection for the retriever's lifetime keeps SQLite's page cache warm across queries
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # C-level rows with name access; dicts are only built where rows get modified
+        self._conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            self._conn.execute(pragma)
+        
+        self.init_epoch()
+        self.init_indexes()
+        self.has_fts = self.init_fts()
     
-    def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+    def get_connection(self) -> sqlite3.Connection:
+        """Get the retriever's database connection; `with` on it scopes a transaction"""
+        return self._conn
     
-    def list_all_urls(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """List all scraped URLs"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT id, url, domain, method_used, status, timestamp, title
-                FROM scrape_results
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,))
-            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
     
-    def get_by_url(self, url: str) -> List[Dict[str, Any]]:
-        """Get all results for a specific URL"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def init_epoch(self):
+        """Add and backfill the ts_epoch column on databases that predate it"""
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(scrape_results)")]
+        if 'ts_epoch' in columns:
+            return
+        
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM scrape_results
-                WHERE url = ? OR url LIKE ?
-                ORDER BY timestamp DESC
-            """, (url, f"%{url}%"))
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # Parse JSON fields
-            for result in results:
-                for field in ['data_json', 'links_json', 'images_json']:
-                    if result.get(field):
-                        try:
-                            result[field.replace('_json', '')] = json.loads(result[field])
-                        except json.JSONDecodeError:
-                            pass
-            
-            return results
+            conn.executescript(self.EPOCH_SCHEMA)
     
-    def get_by_domain(self, domain: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all results for a specific domain"""
+    @staticmethod
+    def _epoch(moment: datetime) -> int:
+        """Epoch seconds for a naive timestamp, read as UTC like strftime('%s', timestamp)"""
+        return int(moment.replace(tzinfo=timezone.utc).timestamp())
+    
+    def init_indexes(self):
+        """Create the indexes behind the list/filter queries and gather planner statistics once"""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM scrape_results
-                WHERE domain = ? OR domain LIKE ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (domain, f"%{domain}%", limit))
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # Parse JSON fields
-            for result in results:
-                for field in ['data_json', 'links_json', 'images_json']:
-                    if result.get(field):
-                        try:
-                            result[field.replace('_json', '')] = json.loads(result[field])
-                        except json.JSONDecodeError:
-                            pass
+            # Names match master_scraper.py, so existing databases don't get duplicates
+            conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_timestamp ON scrape_results(timestamp);
+                CREATE INDEX IF NOT EXISTS idx_domain_ts ON scrape_results(domain, timestamp DESC);
+                CREATE INDEX IF NOT EXISTS idx_status ON scrape_results(status);
+                CREATE INDEX IF NOT EXISTS idx_url ON scrape_results(url);
+            """)
             
-            return results
-    
-    def get_recent(self, hours: int = 24) -> List[Dict[str, Any]]:
-        """Get recent scraping results"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        cutoff_str = cutoff_time.isoformat()
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                conn.execute("ANALYZE")
+    
+    def init_fts(self) -> bool:
+        """Create the full-text search index if missing; False if SQLite lacks FTS5"""
+        try:
+            with self.get_connection() as conn:
+                has_fts = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scrape_fts'"
+                ).fetchone()
+                
+                # Always run (IF NOT EXISTS): also restores the update trigger init_epoch drops
+                conn.executescript(self.FTS_SCHEMA)
+                if not has_fts:
+                    self.rebuild_fts(conn)
+            return True
+        except sqlite3.OperationalError:
+            return False
+    
+    def rebuild_fts(self, conn: Optional[sqlite3.Connection] = None):
+        """Re-index every stored result in the full-text search table"""
+        if conn is not None:
+            conn.execute("INSERT INTO scrape_fts(scrape_fts) VALUES ('rebuild')")
+            return
         
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM scrape_results
-                WHERE timestamp >= ?
-                ORDER BY timestamp DESC
-            """, (cutoff_str,))
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # Parse JSON fields
-            for result in results:
-                for field in ['data_json', 'links_json', 'images_json']:
-                    if result.get(field):
-                        try:
-                            result[field.replace('_json', '')] = json.loads(result[field])
-                        except json.JSONDecodeError:
-                            pass
-            
-            return results
+            conn.execute("INSERT INTO scrape_fts(scrape_fts) VALUES ('rebuild')")
+    
+    def _fetch_results(self, cursor: sqlite3.Cursor, brief: bool = False) -> List[Any]:
+        """Rows of cursor: sqlite3.Row for brief list views, dicts with JSON fields parsed in place otherwise"""
+        if brief:
+            return cursor.fetchall()
+        
+        loads = _loads
+        results = []
+        for row in cursor:
+            result = dict(row)
+            for field, name in _JSON_FIELDS:
+                raw = result[field]
+                if raw:
+                    try:
+                        result[name] = loads(raw)
+                    except json.JSONDecodeError:
+                        # Unparseable blobs stay available as stored
+                        continue
+                    del result[field]
+            results.append(result)
+        return results
     
-    def search_content(self, search_term: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Search for content in scraped data"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM scrape_results
-                WHERE title LIKE ? 
-                   OR data_json LIKE ?
-                   OR url LIKE ?
+    def list_all_urls(self, limit: int = 50) -> List[sqlite3.Row]:
+        """List all scraped URLs"""
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            SELECT id, url, domain, method_used, status, timestamp, title
+            FROM scrape_results
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (limit,))
+        
+        return cursor.fetchall()
+    
+    def get_by_url(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Get all results for a URL: exact matches plus URLs starting with it.
+        
+        Without a scheme both https:// and http:// are tried, so "example.com/blog"
+        finds "https://example.com/blog/post". Matching is case-sensitive and
+        anchored at the start, which lets it use the url index.
+        """
+        prefixes = [url] if '://' in url else [f"https://{url}", f"http://{url}"]
+        params = [url]
+        for prefix in prefixes:
+            params.extend(prefix_bounds(prefix))
+        
+        conn = self.get_connection()
+        ranges = " OR ".join(["(url >= ? AND url < ?)"] * len(prefixes))
+        cursor = conn.execute(f"""
+            SELECT * FROM scrape_results
+            WHERE url = ? OR {ranges}
+            ORDER BY timestamp DESC
+        """, params)
+        
+        return self._fetch_results(cursor)
+    
+    def get_by_domain(self, domain: str, limit: int = 100, brief: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all results for a domain and its subdomains; brief skips the JSON blobs for list views.
+        
+        A leading dot (".example.com") matches the domain exactly, without subdomains.
+        """
+        conn = self.get_connection()
+        if domain.startswith('.'):
+            cursor = conn.execute(f"""
+                SELECT {_LIST_COLUMNS if brief else '*'} FROM scrape_results
+                WHERE domain = ?
                 ORDER BY timestamp DESC
                 LIMIT ?
-            """, (f"%{search_term}%", f"%{search_term}%", f"%{search_term}%", limit))
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # Parse JSON fields and highlight matches
-            for result in results:
-                for field in ['data_json', 'links_json', 'images_json']:
-                    if result.get(field):
-                        try:
-                            result[field.replace('_json', '')] = json.loads(result[field])
-                        except json.JSONDecodeError:
-                            pass
-                
-                # Add search relevance score
-                score = 0
-                if search_term.lower() in (result.get('title') or '').lower():
-                    score += 10
-                if search_term.lower() in (result.get('url') or '').lower():
-                    score += 5
-                if search_term.lower() in (result.get('data_json') or '').lower():
-                    score += 1
-                
-                result['relevance_score'] = score
-            
-            # Sort by relevance
-            results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-            
-            return results
+            """, (domain[1:], limit))
+        else:
+            cursor = conn.execute(f"""
+                SELECT {_LIST_COLUMNS if brief else '*'} FROM scrape_results
+                WHERE domain = ? OR domain LIKE ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (domain, f"%.{domain}", limit))
+        
+        return self._fetch_results(cursor, brief)
+    
+    def get_recent(self, hours: int = 24, brief: bool = False) -> List[Dict[str, Any]]:
+        """Get recent scraping results; brief skips the JSON blobs for list views"""
+        cutoff_epoch = self._epoch(datetime.now() - timedelta(hours=hours))
+        
+        conn = self.get_connection()
+        cursor = conn.execute(f"""
+            SELECT {_LIST_COLUMNS if brief else '*'} FROM scrape_results
+            WHERE ts_epoch >= ?
+            ORDER BY ts_epoch DESC
+        """, (cutoff_epoch,))
+        
+        return self._fetch_results(cursor, brief)
+    
+    def search_content(self, search_term: str, limit: int = 50, brief: bool = False) -> List[Dict[str, Any]]:
+        """Search for content in scraped data, best matches first; brief skips the JSON blobs"""
+        if not self.has_fts:
+            return self._search_like(search_term, limit, brief)
+        
+        match = fts_query(search_term)
+        if not match:
+            return []
+        
+        conn = self.get_connection()
+        # bm25 column weights follow the scrape_fts column order: url, title, data
+        cursor = conn.execute(f"""
+            SELECT {_LIST_COLUMNS_R if brief else 'r.*'}, ROUND(-bm25(scrape_fts, 5.0, 10.0, 1.0), 3) AS relevance_score
+            FROM scrape_fts
+            JOIN scrape_results r ON r.id = scrape_fts.rowid
+            WHERE scrape_fts MATCH ?
+            ORDER BY bm25(scrape_fts, 5.0, 10.0, 1.0)
+            LIMIT ?
+        """, (match, limit))
+        
+        return self._fetch_results(cursor, brief)
+    
+    def _search_like(self, search_term: str, limit: int, brief: bool = False) -> List[Dict[str, Any]]:
+        """Substring search for databases without FTS5 support"""
+        conn = self.get_connection()
+        # Scored and ordered in SQL so Python never re-scans the data blobs. LIKE is
+        # already case-insensitive (ASCII, same as SQLite's lower()), so columns
+        # aren't lowercased per row and the pattern is built once
+        cursor = conn.execute(f"""
+            SELECT {_LIST_COLUMNS if brief else '*'},
+                   (CASE WHEN title LIKE ?1 THEN 10 ELSE 0 END)
+                 + (CASE WHEN url LIKE ?1 THEN 5 ELSE 0 END)
+                 + (CASE WHEN data_json LIKE ?1 THEN 1 ELSE 0 END) AS relevance_score
+            FROM scrape_results
+            WHERE relevance_score > 0
+            ORDER BY relevance_score DESC, timestamp DESC
+            LIMIT ?2
+        """, (f"%{search_term}%", limit))
+        
+        return self._fetch_results(cursor, brief)
+    
+    def _read_all(self, query: str, params: Tuple = ()) -> List[Tuple]:
+        """Run a read-only query on a short-lived connection of its own (safe to call from worker threads)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+    
+    @property
+    def stats_cache_path(self) -> Path:
+        """Sidecar file holding the last get_statistics result (.<db name>.stats.json)"""
+        db_path = Path(self.db_path)
+        return db_path.with_name(f".{db_path.name}.stats.json")
+    
+    def _stats_cache_key(self) -> List[Any]:
+        """Identity of the data the statistics were computed from"""
+        # Daily activity is a window ending today (UTC, like date('now'))
+        key = [datetime.now(timezone.utc).date().isoformat()]
+        # Committed writes land in the WAL first, so it is part of the identity too;
+        # an empty WAL is recreated on every open and carries no data
+        for path in (self.db_path, f"{self.db_path}-wal"):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                st = None
+            if st is not None and st.st_size:
+                key += [st.st_mtime_ns, st.st_size]
+            else:
+                key += [None, None]
+        return key
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get database statistics"""
-        with self.get_connection() as conn:
-            # Basic counts
-            total_results = conn.execute("SELECT COUNT(*) FROM scrape_results").fetchone()[0]
-            successful_results = conn.execute("SELECT COUNT(*) FROM scrape_results WHERE status = 'success'").fetchone()[0]
-            failed_results = conn.execute("SELECT COUNT(*) FROM scrape_results WHERE status = 'failed'").fetchone()[0]
-            
-            # Method statistics
-            method_stats = {}
-            method_cursor = conn.execute("""
+        """Get database statistics, reusing the sidecar cache while the database is unchanged"""
+        cache_path = self.stats_cache_path
+        key = self._stats_cache_key()
+        try:
+            cached = _loads(cache_path.read_bytes())
+            if cached.get('key') == key:
+                return cached['stats']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        stats = self._compute_statistics()
+        
+        # Best effort: a read-only directory just means no caching
+        try:
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(_dumps({'key': key, 'stats': stats}), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return stats
+    
+    def _compute_statistics(self) -> Dict[str, Any]:
+        """Run the statistics queries"""
+        conn = self.get_connection()
+        # Counts and response times in one pass (AVG/MIN/MAX skip NULLs)
+        total_results, successful_results, failed_results, avg_time, min_time, max_time = conn.execute("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(status = 'success'), 0),
+                   COALESCE(SUM(status = 'failed'), 0),
+                   AVG(response_time), MIN(response_time), MAX(response_time)
+            FROM scrape_results
+        """).fetchone()
+        
+        # The grouped aggregates are independent; WAL lets each run on its own reader
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            method_future = executor.submit(self._read_all, """
                 SELECT method_used, COUNT(*) as count, AVG(response_time) as avg_time
                 FROM scrape_results
                 WHERE method_used != 'none'
                 GROUP BY method_used
             """)
-            
-            for method, count, avg_time in method_cursor.fetchall():
-                method_stats[method] = {
-                    'count': count,
-                    'avg_response_time': round(avg_time or 0, 3)
-                }
-            
-            # Domain statistics
-            domain_cursor = conn.execute("""
+            domain_future = executor.submit(self._read_all, """
                 SELECT domain, COUNT(*) as count
                 FROM scrape_results
                 GROUP BY domain
                 ORDER BY count DESC
                 LIMIT 10
             """)
-            
-            top_domains = dict(domain_cursor.fetchall())
-            
-            # Time-based statistics
-            recent_cursor = conn.execute("""
+            daily_future = executor.submit(self._read_all, """
                 SELECT DATE(timestamp) as date, COUNT(*) as count
                 FROM scrape_results
                 WHERE timestamp >= date('now', '-7 days')
                 GROUP BY DATE(timestamp)
                 ORDER BY date DESC
             """)
-            
-            daily_stats = dict(recent_cursor.fetchall())
-            
-            # Response time statistics
-            time_cursor = conn.execute("""
-                SELECT AVG(response_time) as avg, MIN(response_time) as min, MAX(response_time) as max
-                FROM scrape_results
-                WHERE response_time IS NOT NULL
-            """)
-            
-            time_stats = time_cursor.fetchone()
-            
-            return {
-                'total_results': total_results,
-                'successful_results': successful_results,
-                'failed_results': failed_results,
-                'success_rate': round((successful_results / total_results * 100) if total_results > 0 else 0, 2),
-                'method_statistics': method_stats,
-                'top_domains': top_domains,
-                'daily_activity': daily_stats,
-                'response_time_stats': {
-                    'average': round(time_stats[0] or 0, 3),
-                    'minimum': round(time_stats[1] or 0, 3),
-                    'maximum': round(time_stats[2] or 0, 3)
-                }
+        
+        # Method statistics
+        method_stats = {}
+        for method, count, method_avg in method_future.result():
+            method_stats[method] = {
+                'count': count,
+                'avg_response_time': round(method_avg or 0, 3)
             }
-    
-    def export_to_csv(self, filename: str, data: List[Dict[str, Any]] = None):
-        """Export data to CSV file"""
-        if data is None:
-            data = self.list_all_urls(limit=10000)  # Export all data
         
-        if not data:
-            print("❌ No data to export")
-            return
+        # Domain statistics
+        top_domains = dict(domain_future.result())
+        
+        # Time-based statistics
+        daily_stats = dict(daily_future.result())
+        
+        return {
+            'total_results': total_results,
+            'successful_results': successful_results,
+            'failed_results': failed_results,
+            'success_rate': round((successful_results / total_results * 100) if total_results > 0 else 0, 2),
+            'method_statistics': method_stats,
+            'top_domains': top_domains,
+            'daily_activity': daily_stats,
+            'response_time_stats': {
+                'average': round(avg_time or 0, 3),
+                'minimum': round(min_time or 0, 3),
+                'maximum': round(max_time or 0, 3)
+            }
+        }
+    
+    def _iter_all(self, chunk: int = 1000) -> Iterator[sqlite3.Row]:
+        """Yield every stored result (list columns, newest first), fetching chunk rows at a time"""
+        cursor = self.get_connection().execute("""
+            SELECT id, url, domain, method_used, status, timestamp, title
+            FROM scrape_results
+            ORDER BY timestamp DESC
+        """)
+        while True:
+            rows = cursor.fetchmany(chunk)
+            if not rows:
+                break
+            yield from rows
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _build_flattener(keys: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+        """
+        Specialize the CSV row flattener for one column layout.
         
-        # Flatten nested JSON fields
-        flattened_data = []
-        for item in data:
+        Which columns are stored JSON, which were already parsed by a fetch
+        method and which are plain is decided once per layout instead of per cell.
+        """
+        parsed_names = {name for _, name in _JSON_FIELDS}
+        plan = [
+            (key, key[:-len('_json')] if key.endswith('_json') else None, key in parsed_names)
+            for key in keys
+        ]
+        loads, dumps = _loads, _dumps
+        
+        def flatten(item: Any) -> Dict[str, Any]:
             flat_item = {}
-            for key, value in item.items():
-                if key.endswith('_json') and isinstance(value, str):
+            for key, json_name, parsed_name in plan:
+                value = item[key]
+                if json_name is not None and isinstance(value, str):
+                    # Only objects are spread into columns; other JSON is written as stored
+                    if not value.startswith('{'):
+                        flat_item[json_name] = value
+                        continue
                     try:
-                        parsed = json.loads(value)
-                        if isinstance(parsed, dict):
-                            for sub_key, sub_value in parsed.items():
-                                flat_item[f"{key.replace('_json', '')}_{sub_key}"] = str(sub_value)
-                        else:
-                            flat_item[key.replace('_json', '')] = str(parsed)
+                        parsed = loads(value)
                     except json.JSONDecodeError:
-                        flat_item[key] = str(value)
+                        flat_item[key] = value
+                        continue
+                    if isinstance(parsed, dict):
+                        for sub_key, sub_value in parsed.items():
+                            flat_item[f"{json_name}_{sub_key}"] = str(sub_value)
+                    else:
+                        flat_item[json_name] = str(parsed)
+                elif parsed_name and isinstance(value, dict):
+                    for sub_key, sub_value in value.items():
+                        flat_item[f"{key}_{sub_key}"] = str(sub_value)
                 elif isinstance(value, (dict, list)):
-                    flat_item[key] = json.dumps(value)
+                    flat_item[key] = dumps(value)
                 else:
                     flat_item[key] = value
-            
-            flattened_data.append(flat_item)
+            return flat_item
+        
+        return flatten
+    
+    def export_to_csv(self, filename: str, data: List[Dict[str, Any]] = None):
+        """Export data to CSV file, streaming all stored results when data is not given"""
+        rows = iter(data if data is not None else self._iter_all())
+        
+        first = next(rows, None)
+        if first is None:
+            print("❌ No data to export")
+            return
+        
+        # Columns come from the first row; keys only later rows have are dropped
+        keys = tuple(first.keys())
+        flatten = self._build_flattener(keys)
+        flat_first = flatten(first)
+        fieldnames = tuple(flat_first)
+        count = 1
+        
+        def cells() -> Iterator[Iterator[Any]]:
+            # Positional cells in header order; missing columns become None (written empty)
+            nonlocal keys, flatten, count
+            for item in rows:
+                row_keys = tuple(item.keys())
+                if row_keys != keys:
+                    keys, flatten = row_keys, self._build_flattener(row_keys)
+                yield map(flatten(item).get, fieldnames)
+                count += 1
         
-        # Write CSV
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            if flattened_data:
-                writer = csv.DictWriter(f, fieldnames=flattened_data[0].keys())
-                writer.writeheader()
-                writer.writerows(flattened_data)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerow(flat_first.values())
+            writer.writerows(cells())
         
-        print(f"💾 Exported {len(flattened_data)} records to {filename}")
+        print(f"💾 Exported {count} records to {filename}")
     
     def export_to_json(self, filename: str, data: List[Dict[str, Any]] = None):
         """Export data to JSON file"""
         if data is None:
             data = self.list_all_urls(limit=10000)  # Export all data
         
-        # Parse JSON fields
-        for item in data:
-            for field in ['data_json', 'links_json', 'images_json']:
-                if item.get(field) and isinstance(item[field], str):
-                    try:
-                        item[field.replace('_json', '')] = json.loads(item[field])
-                        del item[field]  # Remove the JSON string version
-                    except json.JSONDecodeError:
-                        pass
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+        # Fetch methods hand over parsed fields and list rows; both serialize as-is
+        with open(filename, 'wb') as f:
+            f.write(_dumps_pretty(data))
         
         print(f"💾 Exported {len(data)} records to {filename}")
     
     def cleanup_old_data(self, days: int = 30) -> int:
-        """Remove data older than specified days"""
-        cutoff_time = datetime.now() - timedelta(days=days)
-        cutoff_str = cutoff_time.isoformat()
-        
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                DELETE FROM scrape_results
-                WHERE timestamp < ?
-            """, (cutoff_str,))
-            
-            deleted_count = cursor.rowcount
-            conn.commit()
+        """Remove data older than specified days, committing in batches of CLEANUP_BATCH rows"""
+        cutoff_epoch = self._epoch(datetime.now() - timedelta(days=days))
+        
+        deleted_count = 0
+        while True:
+            with self.get_connection() as conn:
+                cursor = conn.execute("""
+                    DELETE FROM scrape_results
+                    WHERE id IN (
+                        SELECT id FROM scrape_results
+                        WHERE ts_epoch < ?
+                        LIMIT ?
+                    )
+                """, (cutoff_epoch, self.CLEANUP_BATCH))
+            
+            deleted_count += cursor.rowcount
+            if cursor.rowcount < self.CLEANUP_BATCH:
+                break
         
         return deleted_count
 
@@ -322,135 +618,142 @@ class DataFormatter:
     """Format data for display"""
     
     @staticmethod
-    def format_url_list(data: List[Dict[str, Any]]) -> str:
-        """Format URL list for display"""
+    def iter_url_list(data: List[Dict[str, Any]]) -> Iterator[str]:
+        """Format URL list for display, one line at a time"""
         if not data:
-            return "No data found."
+            yield "No data found."
+            return
         
-        output = []
-        output.append("📋 Scraped URLs")
-        output.append("=" * 80)
-        output.append(f"{'ID':<5} {'Status':<8} {'Method':<10} {'URL':<40} {'Title':<20}")
-        output.append("-" * 80)
+        yield "📋 Scraped URLs"
+        yield "=" * 80
+        yield f"{'ID':<5} {'Status':<8} {'Method':<10} {'URL':<40} {'Title':<20}"
+        yield "-" * 80
         
         for item in data:
             status_emoji = "✅" if item['status'] == 'success' else "❌"
-            title = (item.get('title') or 'No title')[:18] + "..." if len(item.get('title') or '') > 18 else (item.get('title') or 'No title')
+            title = (item['title'] or 'No title')[:18] + "..." if len(item['title'] or '') > 18 else (item['title'] or 'No title')
             url = item['url'][:38] + "..." if len(item['url']) > 38 else item['url']
             
-            output.append(f"{item['id']:<5} {status_emoji:<8} {item['method_used']:<10} {url:<40} {title:<20}")
-        
-        return "\n".join(output)
+            yield f"{item['id']:<5} {status_emoji:<8} {item['method_used']:<10} {url:<40} {title:<20}"
     
     @staticmethod
-    def format_detailed_result(data: Dict[str, Any]) -> str:
-        """Format detailed result for display"""
-        output = []
-        output.append(f"🔍 Detailed Result for {data['url']}")
-        output.append("=" * 80)
+    def format_url_list(data: List[Dict[str, Any]]) -> str:
+        """Format URL list for display"""
+        return "\n".join(DataFormatter.iter_url_list(data))
+    
+    @staticmethod
+    def iter_detailed_result(data: Dict[str, Any]) -> Iterator[str]:
+        """Format detailed result for display, one line at a time"""
+        yield f"🔍 Detailed Result for {data['url']}"
+        yield "=" * 80
         
         # Basic info
         status_emoji = "✅" if data['status'] == 'success' else "❌"
         method_emoji = {"scrapy": "🕷️", "pydoll": "⚡", "playwright": "🎭"}.get(data['method_used'], "🔧")
         
-        output.append(f"{status_emoji} Status: {data['status'].upper()}")
-        output.append(f"{method_emoji} Method: {data['method_used'].upper()}")
-        output.append(f"🌐 HTTP Status: {data.get('status_code', 'N/A')}")
-        output.append(f"⏱️  Response Time: {data.get('response_time', 0):.3f}s")
-        output.append(f"🕒 Timestamp: {data['timestamp']}")
+        yield f"{status_emoji} Status: {data['status'].upper()}"
+        yield f"{method_emoji} Method: {data['method_used'].upper()}"
+        yield f"🌐 HTTP Status: {data.get('status_code', 'N/A')}"
+        yield f"⏱️  Response Time: {data.get('response_time', 0):.3f}s"
+        yield f"🕒 Timestamp: {data['timestamp']}"
         
         if data.get('title'):
-            output.append(f"📄 Title: {data['title']}")
+            yield f"📄 Title: {data['title']}"
         
         if data.get('content_length'):
-            output.append(f"📏 Content Length: {data['content_length']:,} characters")
+            yield f"📏 Content Length: {data['content_length']:,} characters"
         
         if data.get('links_count') is not None:
-            output.append(f"🔗 Links Found: {data['links_count']}")
+            yield f"🔗 Links Found: {data['links_count']}"
         
         if data.get('images_count') is not None:
-            output.append(f"🖼️  Images Found: {data['images_count']}")
+            yield f"🖼️  Images Found: {data['images_count']}"
         
         # Extracted data
         if data.get('data'):
-            output.append("\n📊 Extracted Data:")
-            output.append("-" * 40)
+            yield "\n📊 Extracted Data:"
+            yield "-" * 40
             extracted_data = data['data']
             
             for key, value in extracted_data.items():
                 if isinstance(value, list):
-                    output.append(f"  {key}: {len(value)} items")
+                    yield f"  {key}: {len(value)} items"
                     if value and len(value) <= 5:
                         for item in value:
-                            output.append(f"    - {str(item)[:60]}...")
+                            yield f"    - {str(item)[:60]}..."
                 elif isinstance(value, str) and len(value) > 100:
-                    output.append(f"  {key}: {value[:100]}...")
+                    yield f"  {key}: {value[:100]}..."
                 else:
-                    output.append(f"  {key}: {value}")
+                    yield f"  {key}: {value}"
         
         # Links (sample)
         if data.get('links') and len(data['links']) > 0:
-            output.append(f"\n🔗 Sample Links (showing first 5 of {len(data['links'])}):")
-            output.append("-" * 40)
+            yield f"\n🔗 Sample Links (showing first 5 of {len(data['links'])}):"
+            yield "-" * 40
             for link in data['links'][:5]:
-                output.append(f"  - {link}")
+                yield f"  - {link}"
         
         # Images (sample)
         if data.get('images') and len(data['images']) > 0:
-            output.append(f"\n🖼️  Sample Images (showing first 5 of {len(data['images'])}):")
-            output.append("-" * 40)
+            yield f"\n🖼️  Sample Images (showing first 5 of {len(data['images'])}):"
+            yield "-" * 40
             for img in data['images'][:5]:
-                output.append(f"  - {img}")
+                yield f"  - {img}"
         
         if data.get('error_message'):
-            output.append(f"\n❌ Error: {data['error_message']}")
-        
-        return "\n".join(output)
+            yield f"\n❌ Error: {data['error_message']}"
     
     @staticmethod
-    def format_statistics(stats: Dict[str, Any]) -> str:
-        """Format statistics for display"""
-        output = []
-        output.append("📊 Database Statistics")
-        output.append("=" * 60)
+    def format_detailed_result(data: Dict[str, Any]) -> str:
+        """Format detailed result for display"""
+        return "\n".join(DataFormatter.iter_detailed_result(data))
+    
+    @staticmethod
+    def iter_statistics(stats: Dict[str, Any]) -> Iterator[str]:
+        """Format statistics for display, one line at a time"""
+        yield "📊 Database Statistics"
+        yield "=" * 60
         
         # Overview
-        output.append(f"📈 Total Results: {stats['total_results']}")
-        output.append(f"✅ Successful: {stats['successful_results']}")
-        output.append(f"❌ Failed: {stats['failed_results']}")
-        output.append(f"📊 Success Rate: {stats['success_rate']}%")
+        yield f"📈 Total Results: {stats['total_results']}"
+        yield f"✅ Successful: {stats['successful_results']}"
+        yield f"❌ Failed: {stats['failed_results']}"
+        yield f"📊 Success Rate: {stats['success_rate']}%"
         
         # Method statistics
         if stats['method_statistics']:
-            output.append("\n🔧 Method Performance:")
-            output.append("-" * 30)
+            yield "\n🔧 Method Performance:"
+            yield "-" * 30
             for method, data in stats['method_statistics'].items():
                 emoji = {"scrapy": "🕷️", "pydoll": "⚡", "playwright": "🎭"}.get(method, "🔧")
-                output.append(f"  {emoji} {method.capitalize()}: {data['count']} uses, {data['avg_response_time']}s avg")
+                yield f"  {emoji} {method.capitalize()}: {data['count']} uses, {data['avg_response_time']}s avg"
         
         # Response time stats
         time_stats = stats['response_time_stats']
-        output.append(f"\n⏱️  Response Times:")
-        output.append("-" * 20)
-        output.append(f"  Average: {time_stats['average']}s")
-        output.append(f"  Fastest: {time_stats['minimum']}s")
-        output.append(f"  Slowest: {time_stats['maximum']}s")
+        yield f"\n⏱️  Response Times:"
+        yield "-" * 20
+        yield f"  Average: {time_stats['average']}s"
+        yield f"  Fastest: {time_stats['minimum']}s"
+        yield f"  Slowest: {time_stats['maximum']}s"
         
         # Top domains
         if stats['top_domains']:
-            output.append("\n🌐 Top Domains:")
-            output.append("-" * 20)
+            yield "\n🌐 Top Domains:"
+            yield "-" * 20
             for domain, count in list(stats['top_domains'].items())[:5]:
-                output.append(f"  {domain}: {count} results")
+                yield f"  {domain}: {count} results"
         
         # Daily activity
         if stats['daily_activity']:
-            output.append("\n📅 Recent Activity:")
-            output.append("-" * 20)
+            yield "\n📅 Recent Activity:"
+            yield "-" * 20
             for date, count in list(stats['daily_activity'].items())[:7]:
-                output.append(f"  {date}: {count} scrapes")
-        
-        return "\n".join(output)
+                yield f"  {date}: {count} scrapes"
+    
+    @staticmethod
+    def format_statistics(stats: Dict[str, Any]) -> str:
+        """Format statistics for display"""
+        return "\n".join(DataFormatter.iter_statistics(stats))
     
     @staticmethod
     def format_search_results(results: List[Dict[str, Any]], search_term: str) -> str:
@@ -465,12 +768,12 @@ class DataFormatter:
         
         for i, result in enumerate(results[:10], 1):
             status_emoji = "✅" if result['status'] == 'success' else "❌"
-            relevance = result.get('relevance_score', 0)
+            relevance = result['relevance_score']
             
             output.append(f"{i}. {status_emoji} {result['url']}")
             output.append(f"   📊 Relevance: {relevance} | Method: {result['method_used']} | {result['timestamp']}")
             
-            if result.get('title'):
+            if result['title']:
                 # Highlight search term in title
                 highlighted_title = result['title'].replace(
                     search_term, f"**{search_term}**"
@@ -514,13 +817,13 @@ Examples:
     query_group.add_argument(
         '--url',
         type=str,
-        help='Get data for specific URL'
+        help='Get data for specific URL or URL prefix (scheme optional)'
     )
     
     query_group.add_argument(
         '--domain',
         type=str,
-        help='Get all data for specific domain'
+        help='Get all data for specific domain and its subdomains (leading dot: exact domain only)'
     )
     
     query_group.add_argument(
@@ -597,14 +900,17 @@ def main():
     retriever = DataRetriever(args.db)
     formatter = DataFormatter()
     
+    # Table/summary output without export only needs the list columns
+    brief = args.format != 'json' and not args.export
+    
     try:
         # Execute query based on arguments
         if args.list:
             data = retriever.list_all_urls(limit=args.limit)
             if args.format == 'json':
-                output = json.dumps(data, indent=2, default=str)
+                output = [_dumps_pretty(data).decode('utf-8')]
             else:
-                output = formatter.format_url_list(data)
+                output = formatter.iter_url_list(data)
             
         elif args.url:
             data = retriever.get_by_url(args.url)
@@ -613,49 +919,49 @@ def main():
                 return
             
             if args.format == 'json':
-                output = json.dumps(data, indent=2, default=str)
+                output = [_dumps_pretty(data).decode('utf-8')]
             else:
                 # Show most recent result in detail
-                output = formatter.format_detailed_result(data[0])
+                output = formatter.iter_detailed_result(data[0])
                 if len(data) > 1:
-                    output += f"\n\n📝 Note: Found {len(data)} total results for this URL"
+                    output = chain(output, ["", f"📝 Note: Found {len(data)} total results for this URL"])
             
         elif args.domain:
-            data = retriever.get_by_domain(args.domain, limit=args.limit)
+            data = retriever.get_by_domain(args.domain, limit=args.limit, brief=brief)
             if not data:
                 print(f"❌ No data found for domain: {args.domain}")
                 return
             
             if args.format == 'json':
-                output = json.dumps(data, indent=2, default=str)
+                output = [_dumps_pretty(data).decode('utf-8')]
             else:
-                output = formatter.format_url_list(data)
+                output = formatter.iter_url_list(data)
             
         elif args.recent:
-            data = retriever.get_recent(hours=args.recent)
+            data = retriever.get_recent(hours=args.recent, brief=brief)
             if not data:
                 print(f"❌ No data found from last {args.recent} hours")
                 return
             
             if args.format == 'json':
-                output = json.dumps(data, indent=2, default=str)
+                output = [_dumps_pretty(data).decode('utf-8')]
             else:
-                output = formatter.format_url_list(data)
+                output = formatter.iter_url_list(data)
             
         elif args.search:
-            data = retriever.search_content(args.search, limit=args.limit)
+            data = retriever.search_content(args.search, limit=args.limit, brief=brief)
             if not data:
                 print(f"❌ No results found for search term: {args.search}")
                 return
             
             if args.format == 'json':
-                output = json.dumps(data, indent=2, default=str)
+                output = [_dumps_pretty(data).decode('utf-8')]
             else:
-                output = formatter.format_search_results(data, args.search)
+                output = [formatter.format_search_results(data, args.search)]
             
         elif args.stats:
             stats = retriever.get_statistics()
-            output = formatter.format_statistics(stats)
+            output = formatter.iter_statistics(stats)
             data = [stats]  # For export purposes
             
         elif args.cleanup:
@@ -663,8 +969,8 @@ def main():
             print(f"🗑️  Cleaned up {deleted_count} records older than {args.cleanup} days")
             return
         
-        # Display output
-        print(output)
+        # Display output, streamed line by line for long listings
+        sys.stdout.writelines(line + "\n" for line in output)
         
         # Export if requested
         if args.export and 'data' in locals():
@@ -682,6 +988,9 @@ def main():
     except Exception as e:
         print(f"💥 Error: {e}")
         sys.exit(1)
+    
+    finally:
+        retriever.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+DB Pool - Persistent SQLite connections for the API service
+
+Keeps one writer connection and a bounded set of reader connections open for
+the lifetime of the process, so request handlers don't pay connect + PRAGMA
+cost (and WAL/SHM file churn) on every call.
+
+Configuration (environment variables):
+    SCRAPER_DB_POOL_MIN        Reader connections opened at startup (default: 2)
+    SCRAPER_DB_POOL_MAX        Maximum reader connections (default: 10)
+    SCRAPER_DB_POOL_TIMEOUT    Seconds to wait for a free reader (default: 5)
+"""
+
+import asyncio
+import os
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+# Prepared statements kept per connection; the API runs a small fixed set of queries
+STATEMENT_CACHE_SIZE = 256
+
+# Applied to every pooled connection
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes available in time"""
+
+
+class SQLitePool:
+    """Bounded pool of one writer + N reader SQLite connections"""
+
+    def __init__(
+        self,
+        db_path: str,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        self.db_path = db_path
+        self.min_size = min_size if min_size is not None else int(os.environ.get("SCRAPER_DB_POOL_MIN", 2))
+        self.max_size = max_size if max_size is not None else int(os.environ.get("SCRAPER_DB_POOL_MAX", 10))
+        self.timeout = timeout if timeout is not None else float(os.environ.get("SCRAPER_DB_POOL_TIMEOUT", 5))
+
+        self._readers: Optional[asyncio.Queue] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock: Optional[asyncio.Lock] = None
+        self._opened = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._replaced = 0
+
+    def _connect(self, readonly: bool = True) -> sqlite3.Connection:
+        """Open a connection configured for pooled use"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        if readonly:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    def _validate(self, conn: sqlite3.Connection, readonly: bool = True) -> sqlite3.Connection:
+        """Return conn if it is still usable, otherwise a fresh replacement"""
+        try:
+            conn.execute("SELECT 1")
+            return conn
+        except sqlite3.Error:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            self._replaced += 1
+            return self._connect(readonly)
+
+    async def open(self):
+        """Open the writer and the minimum number of reader connections"""
+        self._readers = asyncio.Queue(maxsize=self.max_size)
+        self._writer_lock = asyncio.Lock()
+        self._writer = self._connect(readonly=False)
+
+        for _ in range(min(self.min_size, self.max_size)):
+            self._readers.put_nowait(self._connect())
+            self._opened += 1
+
+    async def close(self):
+        """Close every pooled connection"""
+        if self._readers is not None:
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
+            self._opened = 0
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _acquire_reader(self) -> sqlite3.Connection:
+        """Take an idle reader, growing the pool up to max_size if needed"""
+        try:
+            return self._readers.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        if self._opened < self.max_size:
+            self._opened += 1
+            return self._connect()
+
+        self._waits += 1
+        try:
+            return await asyncio.wait_for(self._readers.get(), self.timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise PoolTimeout(f"No database connection available within {self.timeout}s") from None
+
+    @asynccontextmanager
+    async def get_conn(self, readonly: bool = True) -> AsyncIterator[sqlite3.Connection]:
+        """Borrow a connection; readers are shared, the writer is exclusive"""
+        if readonly:
+            conn = self._validate(await self._acquire_reader())
+            try:
+                yield conn
+            finally:
+                self._readers.put_nowait(conn)
+        else:
+            async with self._writer_lock:
+                self._writer = self._validate(self._writer, readonly=False)
+                yield self._writer
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool usage statistics"""
+        idle = self._readers.qsize() if self._readers is not None else 0
+
+        return {
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "open_readers": self._opened,
+            "idle_readers": idle,
+            "busy_readers": self._opened - idle,
+            "writer_busy": bool(self._writer_lock and self._writer_lock.locked()),
+            "waits": self._waits,
+            "timeouts": self._timeouts,
+            "replaced_connections": self._replaced
+        }
@@ -9,55 +9,443 @@ with the full orchestrator.
 """
 
 import asyncio
+import ipaddress
 import json
 import csv
+import random
 import re
+import socket
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Tuple, Union
+import httpcore
 import httpx
 from urllib.parse import urljoin, urlparse
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import aiodns
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
+
+_DNS_ERRORS = (OSError, aiodns.error.DNSError) if HAS_AIODNS else (OSError,)
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    from cachetools import TTLCache
+    HAS_CACHETOOLS = True
+except ImportError:
+    HAS_CACHETOOLS = False
+
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    from lxml import etree, html as lxml_html
+    HAS_LXML = True
+    # Bodies are handed over as bytes; decode them as UTF-8 like the other extraction paths
+    _LXML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+except ImportError:
+    HAS_LXML = False
+
+
+# Patterns for the regex extraction fallback, compiled once. They run on the raw
+# body bytes: tags are ASCII, so only the captured text needs decoding
+_TITLE_RE = re.compile(rb'<title>(.*?)</title>', re.IGNORECASE)
+# Script and style blocks in one scan; the backreference pairs each with its own closing tag
+_STRIP_RE = re.compile(rb'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_P_RE = re.compile(rb'<p[^>]*>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(rb'<[^>]+>')
+
+# Generator for the simulated research data, drawn a batch at a time
+_RNG = np.random.default_rng() if HAS_NUMPY else None
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that looks up each host once per TTL and connects to the cached addresses.
+    
+    Concurrent first requests to a host share one lookup. Every address found is
+    kept and tried in turn, the first that accepts a connection moving to the
+    front; when none does, the entry is dropped so the next request looks the host
+    up again. TLS still verifies and sends SNI for the hostname, since only the
+    TCP connect uses the address. Lookups cover both IPv4 and IPv6 and go through
+    aiodns when it is installed, the event loop's getaddrinfo otherwise.
+    """
+    
+    def __init__(self, ttl: float = 300.0):
+        self._backend = httpcore.AnyIOBackend()
+        self._resolver = aiodns.DNSResolver() if HAS_AIODNS else None
+        self._ttl = ttl
+        # host -> (lookup of its addresses, monotonic time it expires)
+        self._addresses: Dict[str, Tuple[asyncio.Future, float]] = {}
+    
+    async def _lookup(self, host: str, port: int) -> List[str]:
+        if self._resolver is not None:
+            result = await self._resolver.getaddrinfo(
+                host, family=socket.AF_UNSPEC, port=port, type=socket.SOCK_STREAM
+            )
+            addresses = [node.addr[0] for node in result.nodes]
+            addresses = [a.decode() if isinstance(a, bytes) else a for a in addresses]
+        else:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+            )
+            addresses = [info[4][0] for info in infos]
+        # Resolver order (RFC 6724 preference) without duplicates
+        return list(dict.fromkeys(addresses))
+    
+    def _forget(self, host: str, lookup: asyncio.Future) -> None:
+        cached = self._addresses.get(host)
+        if cached is not None and cached[0] is lookup:
+            del self._addresses[host]
+    
+    async def _resolve(self, host: str, port: int) -> Tuple[asyncio.Future, List[str]]:
+        """Cached addresses for host with the lookup that produced them, looked up again once expired"""
+        now = time.monotonic()
+        cached = self._addresses.get(host)
+        if cached is None or cached[1] <= now:
+            lookup = asyncio.ensure_future(self._lookup(host, port))
+            self._addresses[host] = (lookup, now + self._ttl)
+        else:
+            lookup = cached[0]
+        try:
+            # Shielded: one cancelled request must not cancel the others' lookup
+            return lookup, await asyncio.shield(lookup)
+        except Exception:
+            # Failed lookups are retried by the next request
+            self._forget(host, lookup)
+            raise
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            return await self._backend.connect_tcp(
+                host, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+            )
+        
+        try:
+            lookup, addresses = await self._resolve(host, port)
+        except _DNS_ERRORS as e:
+            # Surface as a connect failure, like the default backend's own lookup
+            raise httpcore.ConnectError(str(e)) from e
+        
+        error: Optional[Exception] = None
+        for address in list(addresses):
+            try:
+                stream = await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+                continue
+            if addresses[0] != address:
+                # Later connections start with the address that answered
+                addresses.remove(address)
+                addresses.insert(0, address)
+            return stream
+        
+        # No address answered: look the host up again next time
+        self._forget(host, lookup)
+        raise error or httpcore.ConnectError(f"No addresses found for {host}")
+    
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+    
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# httpcore errors and the httpx errors clients expect, most specific first
+_HTTPCORE_TO_HTTPX = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+)
+
+
+def _to_httpx_error(exc: Exception) -> Optional[Exception]:
+    """httpx equivalent of an httpcore error, or None for other errors"""
+    for core_error, httpx_error in _HTTPCORE_TO_HTTPX:
+        if isinstance(exc, core_error):
+            return httpx_error(str(exc))
+    return None
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """Response body from the pool, with httpcore errors raised as httpx ones"""
+    
+    def __init__(self, stream: Any):
+        self._stream = stream
+    
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as e:
+            error = _to_httpx_error(e)
+            if error is None:
+                raise
+            raise error from e
+    
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class CachedDNSTransport(httpx.AsyncBaseTransport):
+    """
+    Transport over its own httpcore connection pool, which resolves hosts through CachingResolverBackend.
+    
+    Proxies are not supported; build a plain httpx client when one is needed.
+    """
+    
+    def __init__(
+        self,
+        verify: bool = True,
+        http2: bool = False,
+        limits: httpx.Limits = httpx.Limits(),
+        retries: int = 0,
+        uds: Optional[str] = None,
+        dns_ttl: float = 300.0
+    ):
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            retries=retries,
+            uds=uds,
+            network_backend=CachingResolverBackend(ttl=dns_ttl),
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        try:
+            response = await self._pool.handle_async_request(core_request)
+        except Exception as e:
+            error = _to_httpx_error(e)
+            if error is None:
+                raise
+            raise error from e
+        
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+    
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def create_client() -> httpx.AsyncClient:
+    """HTTP client for the examples; share one so connections and DNS lookups are reused"""
+    return httpx.AsyncClient(
+        transport=CachedDNSTransport(
+            # Concurrent requests to one host share a single TLS connection over HTTP/2
+            http2=HAS_H2,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        ),
+        follow_redirects=True,
+        timeout=30.0
+    )
+
+
+@lru_cache(maxsize=None)
+def _results_dir() -> Path:
+    """Output directory shared by all examples, created once on first use"""
+    path = Path("example_results")
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def _record_fields(record: Any) -> List[str]:
+    """Column names of a dict record, or of a dataclass record or class"""
+    if is_dataclass(record):
+        return [field.name for field in fields(record)]
+    return list(record.keys())
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclass records for the stdlib json fallback (orjson handles them natively)"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+def create_response_cache() -> MutableMapping[str, httpx.Response]:
+    """URL -> response cache for the examples; entries expire after 5 minutes with cachetools"""
+    if HAS_CACHETOOLS:
+        return TTLCache(maxsize=1024, ttl=300)
+    return {}
+
 
 class PracticalExamples:
-    def __init__(self):
-        self.session = None
-        self.results_dir = Path("example_results")
-        self.results_dir.mkdir(exist_ok=True)
+    # Requests in flight at once per example
+    MAX_CONCURRENCY = 16
+    
+    def __init__(
+        self,
+        session: Optional[httpx.AsyncClient] = None,
+        response_cache: Optional[MutableMapping[str, httpx.Response]] = None
+    ):
+        # A passed-in session belongs to the caller and is left open on exit
+        self.session = session
+        self._owns_session = session is None
+        # Share one cache between examples so a URL is fetched once per run
+        self.response_cache = response_cache if response_cache is not None else create_response_cache()
+        self.results_dir = _results_dir()
+        # JSON files queued by save_json, written by flush
+        self._pending: Dict[str, Any] = {}
     
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=30.0,
-            verify=False  # For demo purposes
-        )
+        if self.session is None:
+            self.session = create_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        self.flush()
+        if self.session and self._owns_session:
             await self.session.aclose()
+            self.session = None
+    
+    async def gather_limited(self, coros: Iterable[Awaitable]) -> List[Any]:
+        """Await coros concurrently, at most MAX_CONCURRENCY at a time; failures are returned as exceptions"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*(limited(coro) for coro in coros), return_exceptions=True)
+    
+    async def get_cached(self, url: str) -> httpx.Response:
+        """GET url, reusing the response when this run already fetched it"""
+        response = self.response_cache.get(url)
+        if response is None:
+            response = await self.session.get(url)
+            self.response_cache[url] = response
+        return response
+    
+    async def fetch_all(self, urls: List[str]) -> List[Any]:
+        """GET every url concurrently (through the response cache); results are responses or exceptions, in url order"""
+        return await self.gather_limited(self.get_cached(url) for url in urls)
     
     def save_json(self, data: Any, filename: str):
-        """Save data to JSON file"""
-        filepath = self.results_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-        print(f"💾 Saved: {filepath}")
+        """Queue data to be saved as a JSON file when the example exits (see flush)"""
+        self._pending[filename] = data
     
-    def save_csv(self, data: List[Dict], filename: str):
-        """Save data to CSV file"""
-        if not data:
+    def flush(self):
+        """Write every queued JSON file, each serialized in one pass and written in one call"""
+        pending, self._pending = self._pending, {}
+        for filename, data in pending.items():
+            if HAS_ORJSON:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+            
+            filepath = self.results_dir / filename
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            print(f"💾 Saved: {filepath}")
+    
+    def save_csv(self, data: Iterable[Any], filename: str, fieldnames: Optional[Sequence[str]] = None):
+        """Save dict or dataclass rows to CSV, streaming them from any iterable; columns default to the first row's"""
+        filepath = self.results_dir / filename
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None and fieldnames is None:
             return
+        if first is not None:
+            rows = chain((first,), rows)
+        if fieldnames is None:
+            fieldnames = _record_fields(first)
         
-        filepath = self.results_dir / filename
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+        # Rows are written one at a time; a 1 MiB buffer batches them into few writes
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            if is_dataclass(first):
+                # Fixed layout: cells are read positionally, no per-row dict
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(tuple(getattr(row, name) for name in fieldnames) for row in rows)
+            else:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
         print(f"💾 Saved: {filepath}")
 
 
 # Example 1: News Article Scraper
+@dataclass(slots=True)
+class Article:
+    """One scraped article; fixed fields instead of a per-record dict"""
+    url: str
+    title: str
+    content: str
+    word_count: int
+    scraped_at: str
+    response_time: float
+
+
 class NewsArticleScraper(PracticalExamples):
     async def scrape_news_site(self, base_url: str = "https://httpbin.org"):
         """
@@ -75,25 +463,33 @@ class NewsArticleScraper(PracticalExamples):
         
         articles = []
         
-        for url in article_urls:
+        responses = await self.fetch_all(article_urls)
+        # The pages were fetched together; stamp them once
+        scraped_at = datetime.now().isoformat()
+        
+        for url, response in zip(article_urls, responses):
             try:
                 print(f"\n📡 Scraping: {url}")
-                response = await self.session.get(url)
+                if isinstance(response, Exception):
+                    raise response
                 
                 if response.status_code == 200:
-                    # Simulate article extraction
-                    article = {
-                        "url": url,
-                        "title": self._extract_title(response.text),
-                        "content": self._extract_content(response.text),
-                        "word_count": len(response.text.split()),
-                        "scraped_at": datetime.now().isoformat(),
-                        "response_time": response.elapsed.total_seconds()
-                    }
+                    # Simulate article extraction; title and content share one parse
+                    # Parsed from the raw bytes; the body is never decoded as a whole
+                    doc = self._parse_html(response.content)
+                    article = Article(
+                        url=url,
+                        title=self._extract_title(response.content, doc),
+                        content=self._extract_content(response.content, doc),
+                        # bytes.split: same whitespace tokens without decoding the body first
+                        word_count=len(response.content.split()),
+                        scraped_at=scraped_at,
+                        response_time=response.elapsed.total_seconds()
+                    )
                     articles.append(article)
                     
-                    print(f"✅ Title: {article['title']}")
-                    print(f"📊 Words: {article['word_count']}")
+                    print(f"✅ Title: {article.title}")
+                    print(f"📊 Words: {article.word_count}")
                 
             except Exception as e:
                 print(f"❌ Error scraping {url}: {e}")
@@ -105,20 +501,50 @@ class NewsArticleScraper(PracticalExamples):
         print(f"\n📋 Summary: Scraped {len(articles)} articles")
         return articles
     
-    def _extract_title(self, html: str) -> str:
+    def _parse_html(self, html: bytes):
+        """Parse HTML once with selectolax or lxml, scripts and styles removed (None without either)"""
+        if not html.strip():
+            return None
+        if HAS_SELECTOLAX:
+            tree = LexborHTMLParser(html)
+            tree.strip_tags(['script', 'style'])
+            return tree
+        if not HAS_LXML:
+            return None
+        try:
+            doc = lxml_html.document_fromstring(html, parser=_LXML_PARSER)
+        except (etree.ParserError, ValueError):
+            return None
+        etree.strip_elements(doc, 'script', 'style', with_tail=False)
+        return doc
+    
+    def _extract_title(self, html: bytes, doc=None) -> str:
         """Extract title from HTML"""
-        match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE)
-        return match.group(1).strip() if match else "No title"
+        if HAS_SELECTOLAX and isinstance(doc, LexborHTMLParser):
+            title = doc.css_first('title')
+            text = title.text().strip() if title is not None else ""
+            return text or "No title"
+        if doc is not None:
+            title = doc.find('.//title')
+            text = title.text_content().strip() if title is not None else ""
+            return text or "No title"
+        
+        match = _TITLE_RE.search(html)
+        return match.group(1).decode('utf-8', 'replace').strip() if match else "No title"
     
-    def _extract_content(self, html: str) -> str:
+    def _extract_content(self, html: bytes, doc=None) -> str:
         """Extract main content from HTML"""
+        if HAS_SELECTOLAX and isinstance(doc, LexborHTMLParser):
+            return " ".join(p.text().strip() for p in doc.css('p'))
+        if doc is not None:
+            return " ".join(p.text_content().strip() for p in doc.iter('p'))
+        
         # Remove scripts and styles
-        content = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
+        content = _STRIP_RE.sub(b'', html)
         
         # Extract paragraphs
-        paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', content, re.DOTALL | re.IGNORECASE)
-        clean_paragraphs = [re.sub(r'<[^>]+>', '', p).strip() for p in paragraphs]
+        paragraphs = _P_RE.findall(content)
+        clean_paragraphs = [_TAG_RE.sub(b'', p).decode('utf-8', 'replace').strip() for p in paragraphs]
         
         return " ".join(clean_paragraphs)
 
@@ -149,10 +575,14 @@ class ProductMonitor(PracticalExamples):
         
         monitoring_results = []
         
-        for product in products:
+        responses = await self.fetch_all([product['url'] for product in products])
+        checked_at = datetime.now().isoformat()
+        
+        for product, response in zip(products, responses):
             try:
                 print(f"\n🔍 Monitoring: {product['name']}")
-                response = await self.session.get(product['url'])
+                if isinstance(response, Exception):
+                    raise response
                 
                 if response.status_code == 200:
                     # Simulate price extraction
@@ -165,7 +595,7 @@ class ProductMonitor(PracticalExamples):
                         "target_price": product['target_price'],
                         "price_difference": current_price - product['target_price'],
                         "is_deal": current_price <= product['target_price'],
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": checked_at,
                         "status": "available" if response.status_code == 200 else "unavailable"
                     }
                     
@@ -194,12 +624,14 @@ class ProductMonitor(PracticalExamples):
     
     def _simulate_price_extraction(self) -> float:
         """Simulate price extraction (in real use, parse actual price from HTML)"""
-        import random
         return round(random.uniform(45.00, 120.00), 2)
 
 
 # Example 3: Social Media Content Aggregator
 class SocialMediaAggregator(PracticalExamples):
+    # Simulated topic extraction (in real use, use NLP); lower-case, matched against lowered post text
+    TOPIC_WORDS = ('example', 'demo', 'test', 'social', 'media', 'content')
+    
     async def aggregate_social_content(self):
         """
         Example: Aggregate content from multiple social platforms
@@ -217,22 +649,27 @@ class SocialMediaAggregator(PracticalExamples):
         
         aggregated_content = []
         
-        for platform in platforms:
+        responses = await self.fetch_all([platform['url'] for platform in platforms])
+        scraped_at = datetime.now().isoformat()
+        
+        for platform, response in zip(platforms, responses):
             try:
                 print(f"\n📡 Fetching from {platform['name']}")
-                response = await self.session.get(platform['url'])
+                if isinstance(response, Exception):
+                    raise response
                 
                 if response.status_code == 200:
                     # Extract content based on platform type
+                    # Raw bytes: the JSON parsers decode UTF-8 themselves
                     content = await self._extract_social_content(
-                        response.text, 
+                        response.content, 
                         platform['type']
                     )
                     
                     for item in content:
                         item.update({
                             "platform": platform['name'],
-                            "scraped_at": datetime.now().isoformat(),
+                            "scraped_at": scraped_at,
                             "engagement_score": self._calculate_engagement_score(item)
                         })
                         aggregated_content.append(item)
@@ -243,7 +680,7 @@ class SocialMediaAggregator(PracticalExamples):
                 print(f"❌ Error fetching from {platform['name']}: {e}")
         
         # Sort by engagement score
-        aggregated_content.sort(key=lambda x: x['engagement_score'], reverse=True)
+        aggregated_content.sort(key=itemgetter('engagement_score'), reverse=True)
         
         # Save results
         self.save_json(aggregated_content, "social_content.json")
@@ -257,13 +694,13 @@ class SocialMediaAggregator(PracticalExamples):
         
         return aggregated_content
     
-    async def _extract_social_content(self, content: str, content_type: str) -> List[Dict]:
+    async def _extract_social_content(self, content: Union[str, bytes], content_type: str) -> List[Dict]:
         """Extract content based on format type"""
         posts = []
         
         if content_type == "json":
             try:
-                data = json.loads(content)
+                data = orjson.loads(content) if HAS_ORJSON else json.loads(content)
                 # Simulate extracting posts from JSON
                 posts.append({
                     "post_id": "json_post_1",
@@ -306,14 +743,31 @@ class SocialMediaAggregator(PracticalExamples):
         # Weighted engagement score
         return (likes * 1) + (shares * 3) + (comments * 2)
     
+    def _topic_matcher(self) -> Callable[[str], Iterable[str]]:
+        """Function returning the TOPIC_WORDS that occur in a lower-cased text"""
+        words = self.TOPIC_WORDS
+        if not HAS_AHOCORASICK:
+            return lambda text: [word for word in words if word in text]
+        
+        # One automaton finds every topic word in a single scan of the text
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: (word for _, word in automaton.iter(text))
+    
     def _analyze_trending_topics(self, posts: List[Dict]) -> List[Dict]:
         """Analyze trending topics from posts"""
-        # Simulate topic extraction (in real use, use NLP)
-        common_words = ['example', 'demo', 'test', 'social', 'media', 'content']
+        find_topics = self._topic_matcher()
+        
+        # A post counts once per topic however often it repeats the word
+        mentions_by_word = Counter()
+        for text in [post.get('text', '').lower() for post in posts]:
+            mentions_by_word.update(set(find_topics(text)))
         
         trending = []
-        for word in common_words:
-            mentions = sum(1 for post in posts if word.lower() in post.get('text', '').lower())
+        for word in self.TOPIC_WORDS:
+            mentions = mentions_by_word[word]
             if mentions > 0:
                 trending.append({
                     "topic": word,
@@ -321,11 +775,24 @@ class SocialMediaAggregator(PracticalExamples):
                     "trend_score": mentions * 10
                 })
         
-        return sorted(trending, key=lambda x: x['trend_score'], reverse=True)
+        return sorted(trending, key=itemgetter('trend_score'), reverse=True)
 
 
 # Example 4: Research Data Collector
+@dataclass(slots=True)
+class ResearchDataPoint:
+    """One collected measurement; fixed fields instead of a per-record dict"""
+    source: str
+    metric: str
+    value: float
+    unit: str
+    category: str
+    collected_at: str
+
+
 class ResearchDataCollector(PracticalExamples):
+    CATEGORIES = ("category_a", "category_b", "category_c")
+    
     async def collect_research_data(self):
         """
         Example: Collect data for research purposes
@@ -343,17 +810,20 @@ class ResearchDataCollector(PracticalExamples):
         
         research_data = []
         
-        for source in data_sources:
+        responses = await self.fetch_all([source['url'] for source in data_sources])
+        
+        for source, response in zip(data_sources, responses):
             try:
                 print(f"\n📊 Collecting from {source['name']}")
-                response = await self.session.get(source['url'])
+                if isinstance(response, Exception):
+                    raise response
                 
                 if response.status_code == 200:
                     # Simulate data extraction
-                    data_points = self._extract_research_data(response.text, source['name'])
-                    research_data.extend(data_points)
+                    collected = len(research_data)
+                    research_data.extend(self._iter_research_data(response.content, source['name']))
                     
-                    print(f"✅ Collected {len(data_points)} data points")
+                    print(f"✅ Collected {len(research_data) - collected} data points")
                     
             except Exception as e:
                 print(f"❌ Error collecting from {source['name']}: {e}")
@@ -364,7 +834,7 @@ class ResearchDataCollector(PracticalExamples):
         # Save raw data and analysis
         self.save_json(research_data, "research_raw_data.json")
         self.save_json(analysis, "research_analysis.json")
-        self.save_csv(research_data, "research_data.csv")
+        self.save_csv(research_data, "research_data.csv", _record_fields(ResearchDataPoint))
         
         print(f"\n📈 Research Summary:")
         print(f"  - Total data points: {len(research_data)}")
@@ -373,68 +843,88 @@ class ResearchDataCollector(PracticalExamples):
         
         return research_data, analysis
     
-    def _extract_research_data(self, content: str, source_name: str) -> List[Dict]:
-        """Extract research data points"""
-        import random
-        
+    def _iter_research_data(self, content: bytes, source_name: str) -> Iterator[ResearchDataPoint]:
+        """Extract research data points, yielding them as they are parsed"""
         # Simulate extracting numerical data
-        data_points = []
-        for i in range(random.randint(5, 15)):
-            data_points.append({
-                "source": source_name,
-                "metric": f"metric_{i+1}",
-                "value": round(random.uniform(10, 100), 2),
-                "unit": "percentage",
-                "category": random.choice(["category_a", "category_b", "category_c"]),
-                "collected_at": datetime.now().isoformat()
-            })
+        if _RNG is not None:
+            count = int(_RNG.integers(5, 16))
+            values = _RNG.uniform(10, 100, size=count).round(2).tolist()
+            categories = _RNG.choice(self.CATEGORIES, size=count).tolist()
+        else:
+            count = random.randint(5, 15)
+            values = [round(random.uniform(10, 100), 2) for _ in range(count)]
+            categories = [random.choice(self.CATEGORIES) for _ in range(count)]
+        
+        collected_at = datetime.now().isoformat()
+        for i, (value, category) in enumerate(zip(values, categories), 1):
+            yield ResearchDataPoint(
+                source=source_name,
+                metric=f"metric_{i}",
+                value=value,
+                unit="percentage",
+                category=category,
+                collected_at=collected_at
+            )
+    
+    def _research_stats_numpy(self, data: List[ResearchDataPoint]) -> Tuple[Dict[str, float], Dict[str, Dict]]:
+        """Value statistics and per-category breakdown, computed on arrays"""
+        values = np.fromiter((d.value for d in data), dtype=np.float64, count=len(data))
+        
+        # Categories as integer codes: counts and sums per category in one pass each
+        categories, codes = np.unique([d.category for d in data], return_inverse=True)
+        counts = np.bincount(codes, minlength=len(categories))
+        sums = np.bincount(codes, weights=values, minlength=len(categories))
         
-        return data_points
+        statistics = {
+            "mean": float(values.mean()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "range": float(np.ptp(values))
+        }
+        category_breakdown = {
+            str(cat): {"count": int(count), "average": float(total / count)}
+            for cat, count, total in zip(categories, counts, sums)
+        }
+        return statistics, category_breakdown
     
-    def _analyze_research_data(self, data: List[Dict]) -> Dict[str, Any]:
+    def _research_stats_python(self, data: List[ResearchDataPoint]) -> Tuple[Dict[str, float], Dict[str, Dict]]:
+        """Value statistics and per-category breakdown, without NumPy"""
+        values = [d.value for d in data]
+        statistics = {
+            "mean": sum(values) / len(values),
+            "min": min(values),
+            "max": max(values),
+            "range": max(values) - min(values)
+        }
+        
+        categories = defaultdict(list)
+        for item in data:
+            categories[item.category].append(item.value)
+        
+        category_breakdown = {
+            cat: {"count": len(vals), "average": sum(vals) / len(vals)}
+            for cat, vals in categories.items()
+        }
+        return statistics, category_breakdown
+    
+    def _analyze_research_data(self, data: List[ResearchDataPoint]) -> Dict[str, Any]:
         """Perform analysis on collected data"""
         if not data:
             return {}
         
-        # Basic statistical analysis
-        values = [d['value'] for d in data]
+        if HAS_NUMPY:
+            statistics, category_breakdown = self._research_stats_numpy(data)
+        else:
+            statistics, category_breakdown = self._research_stats_python(data)
         
         analysis = {
             "total_records": len(data),
-            "statistics": {
-                "mean": sum(values) / len(values),
-                "min": min(values),
-                "max": max(values),
-                "range": max(values) - min(values)
-            },
-            "category_breakdown": {},
-            "source_breakdown": {}
+            "statistics": statistics,
+            "category_breakdown": category_breakdown,
+            # Source analysis
+            "source_breakdown": dict(Counter(item.source for item in data))
         }
         
-        # Category analysis
-        categories = {}
-        for item in data:
-            cat = item['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(item['value'])
-        
-        for cat, vals in categories.items():
-            analysis["category_breakdown"][cat] = {
-                "count": len(vals),
-                "average": sum(vals) / len(vals)
-            }
-        
-        # Source analysis  
-        sources = {}
-        for item in data:
-            src = item['source']
-            if src not in sources:
-                sources[src] = 0
-            sources[src] += 1
-        
-        analysis["source_breakdown"] = sources
-        
         return analysis
 
 
@@ -458,15 +948,17 @@ class WebsiteHealthMonitor(PracticalExamples):
         
         health_reports = []
         
-        for website in websites:
+        # Each check is timed on its own, so overlapping them doesn't skew response times;
+        # checks always go to the network, never the response cache
+        checks = await self.gather_limited(self._timed_get(website) for website in websites)
+        
+        for website, check in zip(websites, checks):
             try:
                 print(f"\n🔍 Checking {website}")
+                if isinstance(check, Exception):
+                    raise check
                 
-                start_time = datetime.now()
-                response = await self.session.get(website)
-                end_time = datetime.now()
-                
-                response_time = (end_time - start_time).total_seconds()
+                start_time, response_time, response = check
                 
                 # Analyze response
                 health_report = {
@@ -474,7 +966,7 @@ class WebsiteHealthMonitor(PracticalExamples):
                     "status_code": response.status_code,
                     "response_time": response_time,
                     "timestamp": start_time.isoformat(),
-                    "content_length": len(response.text),
+                    "content_length": len(response.content),
                     "health_score": self._calculate_health_score(response.status_code, response_time),
                     "issues": self._identify_issues(response.status_code, response_time),
                     "recommendations": self._generate_recommendations(response.status_code, response_time)
@@ -517,6 +1009,15 @@ class WebsiteHealthMonitor(PracticalExamples):
         
         return health_reports, summary
     
+    async def _timed_get(self, url: str) -> Tuple[datetime, float, httpx.Response]:
+        """GET url, returning (start time, seconds taken, response)"""
+        start_time = datetime.now()
+        # Monotonic clock for the duration: unaffected by wall-clock adjustments
+        started = time.perf_counter_ns()
+        response = await self.session.get(url)
+        elapsed = (time.perf_counter_ns() - started) * 1e-9
+        return start_time, elapsed, response
+    
     def _calculate_health_score(self, status_code: int, response_time: float) -> int:
         """Calculate health score (0-100)"""
         score = 100
@@ -592,33 +1093,36 @@ async def run_all_examples():
     
     results = {}
     
-    # Example 1: News Articles
-    async with NewsArticleScraper() as news_scraper:
-        results['news'] = await news_scraper.scrape_news_site()
-    
-    print("\n" + "="*60)
-    
-    # Example 2: Product Monitoring  
-    async with ProductMonitor() as product_monitor:
-        results['products'] = await product_monitor.monitor_product_prices()
-    
-    print("\n" + "="*60)
-    
-    # Example 3: Social Media
-    async with SocialMediaAggregator() as social_aggregator:
-        results['social'] = await social_aggregator.aggregate_social_content()
-    
-    print("\n" + "="*60)
-    
-    # Example 4: Research Data
-    async with ResearchDataCollector() as research_collector:
-        results['research'] = await research_collector.collect_research_data()
-    
-    print("\n" + "="*60)
-    
-    # Example 5: Website Health
-    async with WebsiteHealthMonitor() as health_monitor:
-        results['health'] = await health_monitor.monitor_website_health()
+    # One client for all examples: connections to the same host are reused
+    response_cache = create_response_cache()
+    async with create_client() as client:
+        # Example 1: News Articles
+        async with NewsArticleScraper(client, response_cache) as news_scraper:
+            results['news'] = await news_scraper.scrape_news_site()
+        
+        print("\n" + "="*60)
+        
+        # Example 2: Product Monitoring  
+        async with ProductMonitor(client, response_cache) as product_monitor:
+            results['products'] = await product_monitor.monitor_product_prices()
+        
+        print("\n" + "="*60)
+        
+        # Example 3: Social Media
+        async with SocialMediaAggregator(client, response_cache) as social_aggregator:
+            results['social'] = await social_aggregator.aggregate_social_content()
+        
+        print("\n" + "="*60)
+        
+        # Example 4: Research Data
+        async with ResearchDataCollector(client, response_cache) as research_collector:
+            results['research'] = await research_collector.collect_research_data()
+        
+        print("\n" + "="*60)
+        
+        # Example 5: Website Health
+        async with WebsiteHealthMonitor(client, response_cache) as health_monitor:
+            results['health'] = await health_monitor.monitor_website_health()
     
     print("\n" + "="*60)
     print("🎉 All examples completed!")
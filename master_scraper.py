@@ -41,6 +41,14 @@ from vpn_checker import require_vpn
 class ScrapingDatabase:
     """SQLite database for storing scraping results"""
     
+    INSERT_SQL = """
+        INSERT INTO scrape_results (
+            url, domain, method_used, status, status_code, response_time,
+            timestamp, title, content_length, links_count, images_count,
+            data_json, links_json, images_json, error_message
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
     def __init__(self, db_path: str = "scraped_data.db"):
         self.db_path = db_path
         self.init_database()
@@ -85,33 +93,83 @@ class ScrapingDatabase:
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_status ON scrape_results(status);
             """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_domain_ts ON scrape_results(domain, timestamp DESC);
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_url_status_ts ON scrape_results(url, status, timestamp DESC);
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_method ON scrape_results(method_used);
+            """)
+            
+            # Case-insensitive index so domain LIKE 'prefix%' can use it
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_domain_nocase ON scrape_results(domain COLLATE NOCASE);
+            """)
+            
+            # Full-text search index over url/title/data, kept in sync by triggers
+            has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scrape_fts'"
+            ).fetchone()
+            
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS scrape_fts USING fts5(
+                    url, title, data_json,
+                    content='scrape_results', content_rowid='id',
+                    tokenize='porter unicode61'
+                );
+                
+                CREATE TRIGGER IF NOT EXISTS scrape_fts_insert AFTER INSERT ON scrape_results BEGIN
+                    INSERT INTO scrape_fts(rowid, url, title, data_json)
+                    VALUES (new.id, new.url, new.title, new.data_json);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS scrape_fts_delete AFTER DELETE ON scrape_results BEGIN
+                    INSERT INTO scrape_fts(scrape_fts, rowid, url, title, data_json)
+                    VALUES ('delete', old.id, old.url, old.title, old.data_json);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS scrape_fts_update AFTER UPDATE OF url, title, data_json ON scrape_results BEGIN
+                    INSERT INTO scrape_fts(scrape_fts, rowid, url, title, data_json)
+                    VALUES ('delete', old.id, old.url, old.title, old.data_json);
+                    INSERT INTO scrape_fts(rowid, url, title, data_json)
+                    VALUES (new.id, new.url, new.title, new.data_json);
+                END;
+            """)
+            
+            if not has_fts:
+                # Index rows written before the search table existed
+                conn.execute("INSERT INTO scrape_fts(scrape_fts) VALUES ('rebuild')")
+    
+    @staticmethod
+    def result_params(result: Dict[str, Any], dumps=json.dumps) -> tuple:
+        """Build INSERT_SQL parameters from a scraping result, encoding JSON columns with dumps"""
+        return (
+            result['url'],
+            result['domain'],
+            result['method_used'],
+            result['status'],
+            result.get('status_code'),
+            result.get('response_time'),
+            result['timestamp'],
+            result.get('title'),
+            result.get('content_length'),
+            result.get('links_count', 0),
+            result.get('images_count', 0),
+            dumps(result.get('data', {})),
+            dumps(result.get('links', [])),
+            dumps(result.get('images', [])),
+            result.get('error_message')
+        )
     
     def save_result(self, result: Dict[str, Any]) -> int:
         """Save scraping result to database"""
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO scrape_results (
-                    url, domain, method_used, status, status_code, response_time,
-                    timestamp, title, content_length, links_count, images_count,
-                    data_json, links_json, images_json, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                result['url'],
-                result['domain'],
-                result['method_used'],
-                result['status'],
-                result.get('status_code'),
-                result.get('response_time'),
-                result['timestamp'],
-                result.get('title'),
-                result.get('content_length'),
-                result.get('links_count', 0),
-                result.get('images_count', 0),
-                json.dumps(result.get('data', {})),
-                json.dumps(result.get('links', [])),
-                json.dumps(result.get('images', [])),
-                result.get('error_message')
-            ))
+            cursor = conn.execute(self.INSERT_SQL, self.result_params(result))
             return cursor.lastrowid
 
 
@@ -149,16 +207,20 @@ class ProgressiveScraper:
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=30.0,
-            verify=self.config.get('verify_ssl', True)
-        )
+        # A caller-provided client (config['http_client']) is shared and left open
+        self.session = self.config.get('http_client')
+        self._owns_session = self.session is None
+        if self._owns_session:
+            self.session = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=30.0,
+                verify=self.config.get('verify_ssl', True)
+            )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.aclose()
     
     async def scrape_progressive(self, url: str) -> Dict[str, Any]:
@@ -71,7 +71,7 @@ async def scrape_joshsisto_site():
             "scripts": "script[src]",
             "stylesheets": "link[rel='stylesheet']"
         },
-        extract_metadata=True,
+        custom_config={"extract_metadata": True},
         use_proxy=False,
         timeout=15
     )
@@ -97,7 +97,7 @@ async def scrape_joshsisto_site():
         wait_conditions=["networkidle", "domcontentloaded"],
         use_stealth=True,
         human_like_delays=True,
-        capture_screenshot=True,
+        custom_config={"capture_screenshot": True},
         timeout=30
     )
     
@@ -118,10 +118,10 @@ async def scrape_joshsisto_site():
         "scrape_timestamp": datetime.now().isoformat(),
         "site_url": "https://joshsisto.com",
         "extraction_summary": {
-            "title": basic_result.data.get("title") if basic_result.status == ScrapeStatus.SUCCESS else None,
+            "title": basic_result.get_value("title") if basic_result.status == ScrapeStatus.SUCCESS else None,
             "total_links": len(basic_result.links) if basic_result.status == ScrapeStatus.SUCCESS else 0,
             "total_images": len(basic_result.images) if basic_result.status == ScrapeStatus.SUCCESS else 0,
-            "has_dynamic_content": bool(playwright_result.data.get("dynamic_content")) if playwright_result.status == ScrapeStatus.SUCCESS else False,
+            "has_dynamic_content": bool(playwright_result.get_value("dynamic_content")) if playwright_result.status == ScrapeStatus.SUCCESS else False,
         },
         "performance_metrics": {
             "scrapy_time": basic_result.response_time if basic_result.status == ScrapeStatus.SUCCESS else None,
@@ -158,6 +158,7 @@ def save_results(result, filename):
         "method_used": result.method_used.value if result.method_used else None,
         "timestamp": result.timestamp.isoformat() if result.timestamp else None,
         "data": result.data,
+        "data_extra": result.data_extra,
         "links": result.links,
         "images": result.images,
         "error_message": result.error_message,
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Scrape Worker - Runs ProgressiveScraper in worker processes for the API service
+
+The API hands scrape jobs to a process pool so HTML parsing and other
+CPU-heavy work never blocks its event loop. Each worker process keeps one
+event loop alive for its whole lifetime and runs every job on it, sharing
+keep-alive (and, with httpx[http2], HTTP/2) clients across jobs.
+
+Configuration (environment variables):
+    SCRAPER_WORKERS    Worker processes (default: min(4, CPU count); 0 scrapes in-process)
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+import httpx
+
+from master_scraper import ProgressiveScraper
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+WORKERS = int(os.environ.get("SCRAPER_WORKERS", min(4, os.cpu_count() or 1)))
+
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+# Event loop owned by this worker process, created by init_worker
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Shared clients for this process, keyed by TLS verification setting
+_clients: Dict[bool, httpx.AsyncClient] = {}
+
+
+def init_worker():
+    """Process pool initializer: create the worker's event loop"""
+    global _loop
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+
+
+def get_http_client(verify: bool = True) -> httpx.AsyncClient:
+    """Shared keep-alive client for this process"""
+    client = _clients.get(verify)
+    if client is None:
+        client = _clients[verify] = httpx.AsyncClient(
+            http2=HAS_HTTP2,
+            limits=HTTP_LIMITS,
+            follow_redirects=True,
+            timeout=30.0,
+            verify=verify
+        )
+    return client
+
+
+async def close_http_clients():
+    """Close every shared client opened by this process"""
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
+
+
+async def scrape_async(url: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Scrape url with ProgressiveScraper using this process's shared client"""
+    config = {**config, 'http_client': get_http_client(config.get('verify_ssl', True))}
+    async with ProgressiveScraper(config) as scraper:
+        return await scraper.scrape_progressive(url)
+
+
+def scrape(url: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Scrape url on this worker's event loop and return the result dict"""
+    if _loop is None:
+        init_worker()
+    return _loop.run_until_complete(scrape_async(url, config))
@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 import structlog
 from common.models.scrape_request import ScrapeRequest, ScrapeMethod, Priority
+from common.models.html_store import prune_html
 from common.models.scrape_result import ScrapeResult, ScrapeStatus
 from common.models.proxy_config import ProxyConfig
 from .scrapy_service import ScrapyService
@@ -44,6 +45,9 @@ class ExtractionOrchestrator:
             # Initialize Playwright service  
             await self.services[ScrapeMethod.PLAYWRIGHT].initialize()
             
+            # Drop HTML store blobs left expired by earlier runs
+            await asyncio.to_thread(prune_html)
+            
             # Initialize circuit breakers
             for method in ScrapeMethod:
                 self.circuit_breakers[method.value] = {
@@ -66,7 +70,10 @@ class ExtractionOrchestrator:
         try:
             await self.services[ScrapeMethod.PYDOLL].close()
             await self.services[ScrapeMethod.PLAYWRIGHT].close()
-            self.logger.info("Extraction orchestrator closed")
+            
+            # The services move every page into the HTML store; drop expired blobs
+            pruned = await asyncio.to_thread(prune_html)
+            self.logger.info("Extraction orchestrator closed", html_blobs_pruned=pruned)
             
         except Exception as e:
             self.logger.error("Failed to close extraction orchestrator", error=str(e))
@@ -76,7 +83,7 @@ class ExtractionOrchestrator:
         
         # Determine extraction method
         method = scrape_request.method
-        if method == ScrapeMethod.SCRAPY and not self._is_method_available(method):
+        if method is ScrapeMethod.SCRAPY and not self._is_method_available(method):
             # Fallback to alternative method
             method = self._get_fallback_method(scrape_request)
         
@@ -103,8 +110,8 @@ class ExtractionOrchestrator:
         start_time = time.time()
         
         try:
-            # Update scrape request method
-            scrape_request.method = method
+            # Requests are immutable; extract with a copy using the chosen method
+            scrape_request = scrape_request.model_copy(update={"method": method})
             
             # Extract data
             result = await self.services[method].scrape(scrape_request)
@@ -113,11 +120,11 @@ class ExtractionOrchestrator:
             self._update_performance_metrics(
                 method, 
                 time.time() - start_time, 
-                result.status == ScrapeStatus.SUCCESS
+                result.status is ScrapeStatus.SUCCESS
             )
             
             # Update circuit breaker
-            self._update_circuit_breaker(method, result.status == ScrapeStatus.SUCCESS)
+            self._update_circuit_breaker(method, result.status is ScrapeStatus.SUCCESS)
             
             return result
             
@@ -173,7 +180,7 @@ class ExtractionOrchestrator:
                 
                 # Update metrics for batch
                 for result in results:
-                    self._update_circuit_breaker(method, result.status == ScrapeStatus.SUCCESS)
+                    self._update_circuit_breaker(method, result.status is ScrapeStatus.SUCCESS)
                     
             except Exception as e:
                 self.logger.error("Batch extraction failed", method=method, error=str(e))
@@ -264,9 +271,9 @@ class ExtractionOrchestrator:
     
     def _get_fallback_method(self, scrape_request: ScrapeRequest) -> ScrapeMethod:
         """Get fallback method based on request characteristics"""
-        if scrape_request.method == ScrapeMethod.SCRAPY:
+        if scrape_request.method is ScrapeMethod.SCRAPY:
             return ScrapeMethod.PYDOLL
-        elif scrape_request.method == ScrapeMethod.PYDOLL:
+        elif scrape_request.method is ScrapeMethod.PYDOLL:
             return ScrapeMethod.PLAYWRIGHT
         else:
             return ScrapeMethod.SCRAPY
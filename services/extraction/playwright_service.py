@@ -8,7 +8,7 @@ from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from playwright_stealth import stealth_async
 import structlog
 from common.models.scrape_request import ScrapeRequest, ScrapeMethod, AuthType
-from common.models.scrape_result import ScrapeResult, ScrapeStatus
+from common.models.scrape_result import ScrapeResult, ScrapeStatus, split_extracted_data
 from common.models.proxy_config import ProxyConfig
 
 logger = structlog.get_logger()
@@ -102,7 +102,7 @@ class PlaywrightService:
     
     async def scrape(self, scrape_request: ScrapeRequest) -> ScrapeResult:
         """Perform scraping using Playwright"""
-        if scrape_request.method != ScrapeMethod.PLAYWRIGHT:
+        if scrape_request.method is not ScrapeMethod.PLAYWRIGHT:
             raise ValueError(f"Invalid method for PlaywrightService: {scrape_request.method}")
         
         if not self.browser:
@@ -188,7 +188,7 @@ class PlaywrightService:
                         self.logger.warning(f"Wait condition failed: {condition}", error=str(e))
             
             # Handle authentication if needed
-            if scrape_request.auth_type != AuthType.NONE:
+            if scrape_request.auth_type is not AuthType.NONE:
                 success = await self._handle_authentication(page, scrape_request)
                 if not success:
                     return ScrapeResult(
@@ -278,6 +278,9 @@ class PlaywrightService:
             # Calculate render time
             render_time = time.time() - start_time
             
+            # Selector text stays in data; lists and missing fields go to data_extra
+            text_data, extra_data = split_extracted_data(extracted_data)
+            
             # Build result
             result = ScrapeResult(
                 request_id=str(scrape_request.id) if scrape_request.id else "",
@@ -285,7 +288,8 @@ class PlaywrightService:
                 status_code=response.status if response else None,
                 response_headers=dict(response.headers) if response else {},
                 response_time=render_time,
-                data=extracted_data,
+                data=text_data,
+                data_extra=extra_data,
                 raw_html=raw_html if len(raw_html) < 1000000 else raw_html[:1000000],
                 links=links,
                 images=images,
@@ -297,6 +301,9 @@ class PlaywrightService:
                 data_completeness=self._calculate_data_completeness(extracted_data, scrape_request.selectors)
             )
             
+            # Move the page source to the HTML store off the event loop
+            result = await asyncio.to_thread(result.store_html)
+            
             self.logger.info(
                 "Successfully scraped with Playwright",
                 url=page.url,
@@ -341,7 +348,7 @@ class PlaywrightService:
     async def _handle_authentication(self, page: Page, scrape_request: ScrapeRequest) -> bool:
         """Handle different authentication types"""
         try:
-            if scrape_request.auth_type == AuthType.FORM:
+            if scrape_request.auth_type is AuthType.FORM:
                 # Handle form-based authentication
                 if scrape_request.auth_credentials:
                     username = scrape_request.auth_credentials.get("username")
@@ -361,7 +368,7 @@ class PlaywrightService:
                         
                         return True
             
-            elif scrape_request.auth_type == AuthType.BASIC:
+            elif scrape_request.auth_type is AuthType.BASIC:
                 # HTTP Basic Auth (handled by browser context)
                 if scrape_request.auth_credentials:
                     username = scrape_request.auth_credentials.get("username")
@@ -373,7 +380,7 @@ class PlaywrightService:
                         })
                         return True
             
-            elif scrape_request.auth_type == AuthType.BEARER:
+            elif scrape_request.auth_type is AuthType.BEARER:
                 # Bearer token authentication
                 if scrape_request.auth_credentials:
                     token = scrape_request.auth_credentials.get("token")
@@ -7,7 +7,7 @@ from selectolax.parser import HTMLParser
 from fake_useragent import UserAgent
 import structlog
 from common.models.scrape_request import ScrapeRequest, ScrapeMethod
-from common.models.scrape_result import ScrapeResult, ScrapeStatus
+from common.models.scrape_result import ScrapeResult, ScrapeStatus, split_extracted_data
 from common.models.proxy_config import ProxyConfig
 
 logger = structlog.get_logger()
@@ -39,7 +39,7 @@ class PyDollService:
     
     async def scrape(self, scrape_request: ScrapeRequest) -> ScrapeResult:
         """Perform scraping using httpx + selectolax"""
-        if scrape_request.method != ScrapeMethod.PYDOLL:
+        if scrape_request.method is not ScrapeMethod.PYDOLL:
             raise ValueError(f"Invalid method for PyDollService: {scrape_request.method}")
         
         if not self.session:
@@ -233,6 +233,9 @@ class PyDollService:
                 except Exception as e:
                     self.logger.error("Failed to extract text", error=str(e))
             
+            # Selector text stays in data; lists and missing fields go to data_extra
+            text_data, extra_data = split_extracted_data(extracted_data)
+            
             # Build result
             result = ScrapeResult(
                 request_id=str(scrape_request.id) if scrape_request.id else "",
@@ -240,7 +243,8 @@ class PyDollService:
                 status_code=response.status_code,
                 response_headers=dict(response.headers),
                 response_time=time.time() - start_time,
-                data=extracted_data,
+                data=text_data,
+                data_extra=extra_data,
                 raw_html=response.text if len(response.text) < 1000000 else response.text[:1000000],
                 links=links,
                 images=images,
@@ -251,6 +255,9 @@ class PyDollService:
                 data_completeness=self._calculate_data_completeness(extracted_data, scrape_request.selectors)
             )
             
+            # Move the page source to the HTML store off the event loop
+            result = await asyncio.to_thread(result.store_html)
+            
             self.logger.info(
                 "Successfully scraped with PyDoll",
                 url=str(response.url),
@@ -14,7 +14,7 @@ from twisted.internet import reactor, defer
 import structlog
 from fake_useragent import UserAgent
 from common.models.scrape_request import ScrapeRequest, ScrapeMethod
-from common.models.scrape_result import ScrapeResult, ScrapeStatus
+from common.models.scrape_result import ScrapeResult, ScrapeStatus, split_extracted_data
 from common.models.proxy_config import ProxyConfig
 
 logger = structlog.get_logger()
@@ -141,6 +141,9 @@ class ScrapyExtractorSpider(Spider):
                 except Exception as e:
                     self.logger.error("Failed to extract text", error=str(e))
             
+            # Selector text stays in data; lists and missing fields go to data_extra
+            text_data, extra_data = split_extracted_data(extracted_data)
+            
             # Build result
             result = ScrapeResult(
                 request_id=str(self.scrape_request.id) if self.scrape_request.id else "",
@@ -148,7 +151,8 @@ class ScrapyExtractorSpider(Spider):
                 status_code=response.status,
                 response_headers=dict(response.headers),
                 response_time=time.time() - start_time,
-                data=extracted_data,
+                data=text_data,
+                data_extra=extra_data,
                 raw_html=response.text if len(response.text) < 1000000 else response.text[:1000000],  # Limit raw HTML
                 links=links,
                 images=images,
@@ -244,7 +248,7 @@ class ScrapyService:
     
     async def scrape(self, scrape_request: ScrapeRequest) -> ScrapeResult:
         """Perform scraping using Scrapy"""
-        if scrape_request.method != ScrapeMethod.SCRAPY:
+        if scrape_request.method is not ScrapeMethod.SCRAPY:
             raise ValueError(f"Invalid method for ScrapyService: {scrape_request.method}")
         
         try:
@@ -263,7 +267,8 @@ class ScrapyService:
             
             # Get results
             if spider.results:
-                return spider.results[0]  # Return first result
+                # Move the page source to the HTML store off the event loop
+                return await asyncio.to_thread(spider.results[0].store_html)
             else:
                 # No results, create error result
                 return ScrapeResult(
@@ -394,7 +394,7 @@ class TestExtractionOrchestrator:
         assert suggested == ScrapeMethod.SCRAPY
         
         # Request with JavaScript
-        request.wait_conditions = ["networkidle"]
+        request = request.model_copy(update={"wait_conditions": ["networkidle"]})
         suggested = orchestrator.suggest_method(request, ExtractionStrategy.SPEED_FIRST)
         assert suggested == ScrapeMethod.PLAYWRIGHT
     
@@ -419,7 +419,7 @@ class TestExtractionOrchestrator:
         assert suggested == ScrapeMethod.SCRAPY
         
         # Request with complex interaction
-        request.wait_conditions = ["selector:.complex", "delay:5", "networkidle"]
+        request = request.model_copy(update={"wait_conditions": ["selector:.complex", "delay:5", "networkidle"]})
         suggested = orchestrator.suggest_method(request, ExtractionStrategy.COST_OPTIMIZED)
         assert suggested == ScrapeMethod.PLAYWRIGHT
     
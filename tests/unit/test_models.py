@@ -1,6 +1,9 @@
+import json
+import os
 import pytest
 from datetime import datetime
-from common.models.scrape_request import ScrapeRequest, ScrapeMethod, AuthType, Priority
+from common.models.scrape_request import ScrapeRequest, ScrapeRequestExternal, ScrapeMethod, AuthType, Priority
+from common.models.html_store import load_html, prune_html, store_html
 from common.models.scrape_result import ScrapeResult, ScrapeStatus
 from common.models.proxy_config import ProxyConfig, ProxyType, ProxyProvider, ProxyStatus
 
@@ -45,7 +48,10 @@ class TestScrapeRequest:
     def test_scrape_request_validation(self):
         """Test scrape request validation"""
         with pytest.raises(ValueError):
-            ScrapeRequest(url="invalid-url")
+            ScrapeRequestExternal(url="invalid-url")
+        
+        request = ScrapeRequestExternal(url="https://example.com")
+        assert request.url == "https://example.com/"
     
     def test_scrape_request_serialization(self):
         """Test scrape request serialization"""
@@ -60,6 +66,62 @@ class TestScrapeRequest:
         assert data["method"] == "pydoll"
         assert "created_at" in data
         assert "updated_at" in data
+    
+    def test_scrape_request_from_trusted(self):
+        """Test building a scrape request from trusted data"""
+        request = ScrapeRequest.from_trusted({
+            "url": "https://example.com",
+            "method": "playwright",
+            "priority": "high"
+        })
+        
+        assert request.method is ScrapeMethod.PLAYWRIGHT
+        assert request.priority is Priority.HIGH
+        assert request.auth_type is AuthType.NONE
+        assert request.headers == {}
+    
+    def test_enum_coerce(self):
+        """Test string to enum member coercion"""
+        assert ScrapeMethod.coerce("pydoll") is ScrapeMethod.PYDOLL
+        assert ScrapeMethod.coerce(ScrapeMethod.PYDOLL) is ScrapeMethod.PYDOLL
+        assert Priority.coerce("urgent") is Priority.URGENT
+        assert ScrapeStatus.coerce("rate_limited") is ScrapeStatus.RATE_LIMITED
+        
+        with pytest.raises(KeyError):
+            AuthType.coerce("unknown")
+    
+    def test_scrape_request_shared_empty_defaults(self):
+        """Test untouched container fields share one read-only empty default"""
+        first = ScrapeRequest(url="https://example.com")
+        second = ScrapeRequest(url="https://example.org")
+        
+        assert first.cookies is second.cookies
+        assert first.wait_conditions is second.wait_conditions
+        assert first.cookies == {}
+        
+        with pytest.raises(TypeError):
+            first.cookies["session"] = "abc"
+        with pytest.raises(TypeError):
+            first.wait_conditions.append("networkidle")
+        
+        updated = first.model_copy(update={"cookies": {"session": "abc"}})
+        assert updated.cookies == {"session": "abc"}
+        assert second.cookies == {}
+    
+    def test_scrape_request_packed_round_trip(self):
+        """Test packing string maps for queue transport"""
+        request = ScrapeRequest(
+            url="https://example.com",
+            headers={"User-Agent": "test", "Accept": "text/html"},
+            selectors={"title": "h1"}
+        )
+        
+        packed = request.to_packed()
+        assert packed.headers == (("User-Agent", "Accept"), ("test", "text/html"))
+        assert packed.cookies == ((), ())
+        
+        unpacked = ScrapeRequest.from_packed(packed)
+        assert unpacked.to_field_dict() == request.to_field_dict()
 
 
 class TestScrapeResult:
@@ -108,6 +170,175 @@ class TestScrapeResult:
         assert data["status"] == "success"
         assert data["status_code"] == 200
         assert len(data["links"]) == 2
+    
+    def test_scrape_result_from_trusted(self):
+        """Test building a scrape result from trusted data"""
+        result = ScrapeResult.from_trusted({
+            "request_id": "test123",
+            "status": "failed",
+            "error_message": "Connection timeout"
+        })
+        
+        assert result.status is ScrapeStatus.FAILED
+        assert result.error_message == "Connection timeout"
+        assert result.retry_count == 0
+    
+    def test_scrape_result_immutable(self):
+        """Test scrape results are frozen and reject unknown fields"""
+        result = ScrapeResult(request_id="test123", status=ScrapeStatus.SUCCESS)
+        
+        with pytest.raises(ValueError):
+            result.status_code = 500
+        
+        with pytest.raises(ValueError):
+            ScrapeResult(request_id="test123", status=ScrapeStatus.SUCCESS, unknown_field=1)
+    
+    def test_scrape_result_field_dict_round_trip(self):
+        """Test to_field_dict round-trips through from_trusted"""
+        result = ScrapeResult(
+            request_id="test123",
+            status=ScrapeStatus.SUCCESS,
+            links=["https://example.com/page1"],
+            _id="abc123"
+        )
+        
+        copy = ScrapeResult.from_trusted(result.to_field_dict())
+        assert copy.to_field_dict() == result.to_field_dict()
+        assert copy.id == "abc123"
+    
+    def test_scrape_result_raw_html_stored_by_reference(self, tmp_path, monkeypatch):
+        """Test raw HTML stays inline until store_html moves it to the store"""
+        monkeypatch.setenv("SCRAPER_HTML_STORE", str(tmp_path))
+        html = "<html><body>Test Page</body></html>"
+        
+        inline = ScrapeResult(request_id="test123", status=ScrapeStatus.SUCCESS, raw_html=html)
+        
+        # Validation never touches the disk
+        assert inline.raw_html == html
+        assert inline.raw_html_ref is None
+        assert not list(tmp_path.rglob("*.html"))
+        
+        result = inline.store_html()
+        
+        assert result.raw_html_ref is not None
+        assert "raw_html" not in result.dict()
+        assert result.raw_html == html
+        assert result.with_inline_html()["raw_html"] == html
+        
+        # Identical content shares one stored blob
+        again = ScrapeResult.from_trusted({"request_id": "test456", "status": "success", "raw_html": html}).store_html()
+        assert again.raw_html_ref == result.raw_html_ref
+        assert len(list(tmp_path.rglob("*.html"))) == 1
+        assert not list(tmp_path.rglob("*.tmp"))
+    
+    def test_html_store_prune(self, tmp_path, monkeypatch):
+        """Test prune_html removes only blobs not stored again within max_age"""
+        monkeypatch.setenv("SCRAPER_HTML_STORE", str(tmp_path))
+        old_ref = store_html("<html>old</html>")
+        new_ref = store_html("<html>new</html>")
+        old_path = next(tmp_path.rglob(f"{old_ref}.html"))
+        os.utime(old_path, (0, 0))
+        
+        assert prune_html(max_age=3600) == 1
+        assert load_html(old_ref) is None
+        assert load_html(new_ref) == "<html>new</html>"
+    
+    def test_scrape_result_parse_many(self, tmp_path, monkeypatch):
+        """Test batch parsing of scrape results"""
+        monkeypatch.setenv("SCRAPER_HTML_STORE", str(tmp_path))
+        raw = json.dumps([
+            {"request_id": "a", "status": "success", "status_code": 200},
+            {"request_id": "b", "status": "failed", "raw_html": "<html></html>"}
+        ]).encode()
+        
+        results = ScrapeResult.parse_many(raw)
+        
+        assert [result.request_id for result in results] == ["a", "b"]
+        assert results[1].status is ScrapeStatus.FAILED
+        assert results[1].raw_html == "<html></html>"
+    
+    def test_scrape_result_to_json_bytes(self):
+        """Test fast JSON encoding of a scrape result"""
+        result = ScrapeResult(
+            request_id="test123",
+            status=ScrapeStatus.SUCCESS,
+            status_code=200,
+            links=["https://example.com/page1"]
+        )
+        
+        data = json.loads(result.to_json_bytes())
+        assert data["request_id"] == "test123"
+        assert data["status"] == "success"
+        assert data["links"] == ["https://example.com/page1"]
+    
+    def test_scrape_result_detail_only_when_needed(self):
+        """Test bulky fields live on an optional detail object"""
+        result = ScrapeResult(request_id="test123", status=ScrapeStatus.SUCCESS, status_code=200, links=[])
+        
+        assert result.detail is None
+        assert result.links == []
+        assert "links" not in result.dict()
+        assert "stack_trace" not in json.loads(result.to_json_bytes())
+        
+        failed = ScrapeResult(
+            request_id="test123",
+            status=ScrapeStatus.FAILED,
+            error_message="Connection timeout",
+            stack_trace="Traceback ..."
+        )
+        
+        assert failed.detail.stack_trace == "Traceback ..."
+        assert failed.dict()["error_message"] == "Connection timeout"
+        assert "detail" not in failed.dict()
+    
+    def test_scrape_result_identity_is_request_id(self):
+        """Test results compare and hash by request_id only"""
+        first = ScrapeResult(request_id="test123", status=ScrapeStatus.FAILED, retry_count=1)
+        retried = ScrapeResult.from_trusted({"request_id": "".join(["test", "123"]), "status": "success"})
+        
+        assert first == retried
+        assert first.request_id is retried.request_id
+        assert len({first, retried, ScrapeResult(request_id="other", status=ScrapeStatus.SUCCESS)}) == 2
+    
+    def test_scrape_result_without_request_id_is_distinct(self):
+        """Test results of id-less requests are never deduplicated into each other"""
+        success = ScrapeResult(request_id="", status=ScrapeStatus.SUCCESS)
+        failure = ScrapeResult(request_id="", status=ScrapeStatus.FAILED, error_message="x")
+        
+        assert success != failure
+        assert success == success
+        assert len({success, failure}) == 2
+    
+    def test_scrape_result_non_text_data_split(self):
+        """Test non-string extracted values are kept in data_extra"""
+        result = ScrapeResult(
+            request_id="test123",
+            status=ScrapeStatus.SUCCESS,
+            data={"title": "Test Page", "links": ["a", "b"], "price": None}
+        )
+        
+        assert result.data == {"title": "Test Page"}
+        assert result.data_extra == {"links": ["a", "b"], "price": None}
+        assert result.get_value("links") == ["a", "b"]
+        assert result.get_value("missing", "") == ""
+    
+    def test_scrape_result_msgpack_round_trip(self):
+        """Test positional msgpack transport encoding"""
+        pytest.importorskip("msgpack")
+        result = ScrapeResult(
+            request_id="test123",
+            status=ScrapeStatus.FAILED,
+            data={"title": "Test Page"},
+            error_message="Connection timeout",
+            retry_count=2
+        )
+        
+        copy = ScrapeResult.from_msgpack(result.to_msgpack())
+        
+        assert copy.to_field_dict() == result.to_field_dict()
+        assert copy.status is ScrapeStatus.FAILED
+        assert copy.error_message == "Connection timeout"
+        assert len(result.to_msgpack()) < len(result.to_json_bytes())
 
 
 class TestProxyConfig:
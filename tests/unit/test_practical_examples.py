@@ -0,0 +1,160 @@
+import pytest
+import asyncio
+import csv
+import httpcore
+import httpx
+from examples.practical_examples import CachedDNSTransport, CachingResolverBackend, PracticalExamples, ResearchDataPoint
+
+
+class StubNetworkBackend:
+    """Inner backend that only accepts connections to the given addresses"""
+    
+    def __init__(self, reachable):
+        self.reachable = set(reachable)
+        self.attempts = []
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.attempts.append(host)
+        if host not in self.reachable:
+            raise httpcore.ConnectError(f"connection to {host} refused")
+        return host
+
+
+def make_backend(addresses, reachable):
+    backend = CachingResolverBackend()
+    backend._backend = StubNetworkBackend(reachable)
+    lookups = []
+    
+    async def lookup(host, port):
+        lookups.append(host)
+        return list(addresses)
+    
+    backend._lookup = lookup
+    return backend, lookups
+
+
+class TestCachingResolverBackend:
+    """Test address caching and failover in CachingResolverBackend"""
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_next_address(self):
+        """Test an unreachable first address falls over to the next one, which is then tried first"""
+        backend, lookups = make_backend(["::1", "127.0.0.1"], reachable=["127.0.0.1"])
+        
+        assert await backend.connect_tcp("localhost", 80) == "127.0.0.1"
+        assert await backend.connect_tcp("localhost", 80) == "127.0.0.1"
+        
+        assert backend._backend.attempts == ["::1", "127.0.0.1", "127.0.0.1"]
+        assert lookups == ["localhost"]
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_host_is_looked_up_again(self):
+        """Test a host none of whose addresses answer is evicted from the cache"""
+        backend, lookups = make_backend(["::1", "127.0.0.1"], reachable=[])
+        
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("localhost", 80)
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("localhost", 80)
+        
+        assert lookups == ["localhost", "localhost"]
+    
+    @pytest.mark.asyncio
+    async def test_ip_literal_skips_lookup(self):
+        """Test IP literals connect directly"""
+        backend, lookups = make_backend([], reachable=["127.0.0.1"])
+        
+        assert await backend.connect_tcp("127.0.0.1", 80) == "127.0.0.1"
+        assert lookups == []
+    
+    @pytest.mark.asyncio
+    async def test_expired_addresses_are_looked_up_again(self):
+        """Test cached addresses are refreshed once their TTL passes"""
+        backend, lookups = make_backend(["127.0.0.1"], reachable=["127.0.0.1"])
+        backend._ttl = 0.0
+        
+        await backend.connect_tcp("localhost", 80)
+        await backend.connect_tcp("localhost", 80)
+        
+        assert lookups == ["localhost", "localhost"]
+
+
+class TestCachedDNSTransport:
+    """Test CachedDNSTransport against a local server"""
+    
+    @pytest.mark.asyncio
+    async def test_get_through_ipv4_after_ipv6_fails(self):
+        """Test a request succeeds when the host's first address has no listener"""
+        async def respond(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+            await writer.drain()
+            writer.close()
+        
+        server = await asyncio.start_server(respond, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = CachedDNSTransport()
+        
+        async def lookup(host, port):
+            return ["::1", "127.0.0.1"]
+        
+        transport._pool._network_backend._lookup = lookup
+        
+        async with server:
+            async with httpx.AsyncClient(transport=transport) as client:
+                response = await client.get(f"http://localhost:{port}/")
+        
+        assert response.status_code == 200
+        assert response.text == "ok"
+    
+    @pytest.mark.asyncio
+    async def test_connect_failure_is_httpx_error(self):
+        """Test httpcore connect errors reach the client as httpx errors"""
+        transport = CachedDNSTransport()
+        
+        async def lookup(host, port):
+            return ["127.0.0.1"]
+        
+        transport._pool._network_backend._lookup = lookup
+        
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://localhost:1/")
+
+
+@pytest.fixture
+def examples(tmp_path):
+    examples = PracticalExamples()
+    examples.results_dir = tmp_path
+    return examples
+
+
+def make_points():
+    return [
+        ResearchDataPoint("src", "latency", 1.5, "ms", "network", "2024-01-01"),
+        ResearchDataPoint("src", "uptime", 99.0, "%", "network", "2024-01-02")
+    ]
+
+
+class TestSaveCsv:
+    """Test CSV output of PracticalExamples.save_csv"""
+    
+    def test_dataclass_rows_single_field(self, examples, tmp_path):
+        """Test dataclass rows can be saved with a single column"""
+        examples.save_csv(make_points(), "points.csv", ["value"])
+        
+        with open(tmp_path / "points.csv", newline="") as f:
+            assert list(csv.reader(f)) == [["value"], ["1.5"], ["99.0"]]
+    
+    def test_dataclass_rows_selected_fields(self, examples, tmp_path):
+        """Test dataclass rows are written in fieldnames order"""
+        examples.save_csv(make_points(), "points.csv", ["metric", "value"])
+        
+        with open(tmp_path / "points.csv", newline="") as f:
+            assert list(csv.reader(f)) == [["metric", "value"], ["latency", "1.5"], ["uptime", "99.0"]]
+    
+    def test_dict_rows_format(self, examples, tmp_path):
+        """Test dict rows keep csv module formatting (unquoted strings, Python booleans)"""
+        examples.save_csv([{"name": "a", "ok": True}, {"name": "b", "ok": False}], "rows.csv")
+        
+        assert (tmp_path / "rows.csv").read_bytes() == b"name,ok\r\na,True\r\nb,False\r\n"